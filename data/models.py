@@ -3,6 +3,7 @@ Data models for Elite Dangerous Records Helper.
 Defines data structures used throughout the application.
 """
 
+import functools
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
@@ -25,6 +26,32 @@ class System:
     discovery_date: Optional[datetime] = None
     id: Optional[int] = None
     
+    @functools.cached_property
+    def display_categories(self) -> str:
+        """Get the category summary line shown on system cards.
+
+        Computed once per instance; the UI treats systems as immutable
+        snapshots, so the cache never needs invalidating.
+
+        Returns:
+            str: The formatted category line, or an empty string.
+        """
+        if not self.categories:
+            return ""
+        text = " • ".join(self.categories[:3])
+        if len(self.categories) > 3:
+            text += f" (+{len(self.categories) - 3} more)"
+        return text
+
+    @functools.cached_property
+    def display_coords(self) -> str:
+        """Get the formatted coordinate line shown on system cards.
+
+        Returns:
+            str: The formatted coordinate line.
+        """
+        return f"Coordinates: {self.x:.2f}, {self.y:.2f}, {self.z:.2f}"
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'System':
         """Create a System instance from a dictionary.
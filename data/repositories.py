@@ -3,9 +3,27 @@ Repository classes for Elite Dangerous Records Helper.
 Provides a layer of abstraction between the database and the application.
 """
 
-from typing import List, Dict, Optional, Any, Union
+import heapq
+from typing import List, Dict, Optional, Any, Tuple, Union
 from .models import System, Commander, CategoryImage, JournalEvent
 
+# Try to import numpy for vectorized distance math
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    print("[WARNING] numpy not available, spatial queries use pure Python")
+    np = None
+    HAS_NUMPY = False
+
+# Try to import scipy for the k-d tree spatial index
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = HAS_NUMPY
+except ImportError:
+    cKDTree = None
+    HAS_SCIPY = False
+
 
 class SystemRepository:
     """Repository for star system data."""
@@ -18,6 +36,13 @@ class SystemRepository:
         """
         self.db = database_service
 
+        # Cached (systems, coordinates) snapshot for spatial queries,
+        # built on first use and invalidated on writes
+        self._coords_cache = None
+
+        # Lazily built k-d tree over the snapshot (scipy only)
+        self._kdtree = None
+
     def get_all(self) -> List[System]:
         """Get all systems.
 
@@ -66,6 +91,7 @@ class SystemRepository:
         result = self.db.add_system(system_data)
         if not result:
             return None
+        self.invalidate_coords_cache()
         return System.from_dict(result)
 
     def update(self, system: System) -> Optional[System]:
@@ -84,6 +110,7 @@ class SystemRepository:
         result = self.db.update_system(system.id, system_data)
         if not result:
             return None
+        self.invalidate_coords_cache()
         return System.from_dict(result)
 
     def delete(self, system_id: int) -> bool:
@@ -95,7 +122,10 @@ class SystemRepository:
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self.db.delete_system(system_id)
+        result = self.db.delete_system(system_id)
+        if result:
+            self.invalidate_coords_cache()
+        return result
 
     def claim(self, system_name: str, commander_name: str) -> bool:
         """Claim a system for a commander.
@@ -162,7 +192,137 @@ class SystemRepository:
         system.done = True
         return self.update(system) is not None
 
-    def get_nearest_systems(self, current_x: float, current_y: float, current_z: float, 
+    def invalidate_coords_cache(self):
+        """Drop the cached coordinate snapshot after a write."""
+        self._coords_cache = None
+        self._kdtree = None
+
+    def _get_kdtree(self):
+        """Get the k-d tree over the coordinate snapshot, if possible.
+
+        Returns:
+            Optional[Any]: The cKDTree, or None when scipy is missing
+                or there are no systems.
+        """
+        if not HAS_SCIPY:
+            return None
+        if self._kdtree is None:
+            _, coords = self._get_coords_cache()
+            if len(coords) == 0:
+                return None
+            self._kdtree = cKDTree(coords)
+        return self._kdtree
+
+    def _get_coords_cache(self):
+        """Get the cached (systems, coordinates) snapshot.
+
+        The snapshot is built on first use. With numpy available the
+        coordinates live in a contiguous (N, 3) float32 array so distance
+        math runs vectorized (float32 also halves the memory traffic of
+        a scan); otherwise they are three parallel axis lists, which
+        keeps the hot loop on plain list indexing instead of attribute
+        lookups on System objects.
+
+        Returns:
+            Tuple[List[System], Any]: The systems and their coordinates.
+        """
+        if self._coords_cache is None:
+            systems = self.get_all()
+            if HAS_NUMPY:
+                coords = np.array(
+                    [(s.x, s.y, s.z) for s in systems], dtype=np.float32
+                ).reshape(-1, 3)
+            else:
+                coords = (
+                    [s.x for s in systems],
+                    [s.y for s in systems],
+                    [s.z for s in systems]
+                )
+            self._coords_cache = (systems, coords)
+        return self._coords_cache
+
+    def coords(self):
+        """Get the coordinate snapshot for spatial math.
+
+        Returns:
+            The (N, 3) float32 array when numpy is available, otherwise
+            an (xs, ys, zs) tuple of parallel lists.
+        """
+        return self._get_coords_cache()[1]
+
+    def get_systems_in_range(self, center_x: float, center_y: float, center_z: float,
+                             r_min: float, r_max: float) -> Tuple[List[System], List[float]]:
+        """Get systems whose distance from a point lies in (r_min, r_max).
+
+        Distances are filtered as squared values against squared bounds,
+        so no square root is taken for systems outside the annulus.
+
+        Args:
+            center_x (float): Center X coordinate
+            center_y (float): Center Y coordinate
+            center_z (float): Center Z coordinate
+            r_min (float): Exclusive minimum distance
+            r_max (float): Exclusive maximum distance
+
+        Returns:
+            Tuple[List[System], List[float]]: Matching systems and their
+                distances, in cache order.
+        """
+        try:
+            systems, coords = self._get_coords_cache()
+            if not systems:
+                return [], []
+
+            r2_min = r_min * r_min
+            r2_max = r_max * r_max
+
+            # k-d tree path: collect the r_max ball in O(log N + k) and
+            # post-filter the inner radius on just those k candidates
+            kdtree = self._get_kdtree()
+            if kdtree is not None:
+                center = np.array([center_x, center_y, center_z], dtype=np.float32)
+                ball = kdtree.query_ball_point(center, r=r_max)
+                if not ball:
+                    return [], []
+                ball = np.asarray(ball, dtype=np.intp)
+                diff = coords[ball] - center
+                d2 = np.einsum('ij,ij->i', diff, diff)
+                keep = (d2 > r2_min) & (d2 < r2_max)
+                idxs = ball[keep]
+                return (
+                    [systems[i] for i in idxs],
+                    np.sqrt(d2[keep]).tolist()
+                )
+
+            if HAS_NUMPY:
+                diff = coords - np.array(
+                    [center_x, center_y, center_z], dtype=np.float32
+                )
+                d2 = np.einsum('ij,ij->i', diff, diff)
+                idxs = np.flatnonzero((d2 > r2_min) & (d2 < r2_max))
+                return (
+                    [systems[i] for i in idxs],
+                    np.sqrt(d2[idxs]).tolist()
+                )
+
+            # Pure-Python fallback over the parallel axis lists
+            xs, ys, zs = coords
+            matches = []
+            distances = []
+            for i, system in enumerate(systems):
+                dx = xs[i] - center_x
+                dy = ys[i] - center_y
+                dz = zs[i] - center_z
+                d2 = dx * dx + dy * dy + dz * dz
+                if r2_min < d2 < r2_max:
+                    matches.append(system)
+                    distances.append(d2 ** 0.5)
+            return matches, distances
+        except Exception as e:
+            print(f"[ERROR] Error getting systems in range: {e}")
+            return [], []
+
+    def get_nearest_systems(self, current_x: float, current_y: float, current_z: float,
                            limit: int = 20, category_filter: List[str] = None) -> List[System]:
         """Get systems nearest to the specified coordinates.
 
@@ -195,13 +355,15 @@ class SystemRepository:
                         if not any(cat in system.categories for cat in category_filter):
                             continue
 
-                    # Calculate distance
+                    # Calculate squared distance; sqrt is monotonic, so
+                    # ordering by d2 gives the same sort and the actual
+                    # distance is never needed here
                     dx = system.x - current_x
                     dy = system.y - current_y
                     dz = system.z - current_z
-                    distance = (dx * dx + dy * dy + dz * dz) ** 0.5
+                    d2 = dx * dx + dy * dy + dz * dz
 
-                    systems_with_distance.append((system, distance))
+                    systems_with_distance.append((system, d2))
                 except Exception as e:
                     print(f"[ERROR] Error processing system {system_data.get('name', 'Unknown')}: {e}")
                     continue
@@ -216,7 +378,8 @@ class SystemRepository:
             return []
 
     def get_unclaimed_systems(self, current_x: float, current_y: float, current_z: float,
-                             category_filter: List[str] = None) -> List[Dict[str, Any]]:
+                             category_filter: List[str] = None,
+                             limit: int = None) -> List[Dict[str, Any]]:
         """Get unclaimed systems sorted by distance.
 
         Args:
@@ -224,6 +387,9 @@ class SystemRepository:
             current_y (float): Current Y coordinate
             current_z (float): Current Z coordinate
             category_filter (List[str], optional): List of categories to filter by
+            limit (int, optional): Return only the N nearest systems. A
+                limited query uses a heap-based top-k selection, which is
+                O(N) instead of the O(N log N) full sort.
 
         Returns:
             List[Dict[str, Any]]: List of unclaimed systems with distance
@@ -283,10 +449,12 @@ class SystemRepository:
                         y = float(system_data.get("y", 0))
                         z = float(system_data.get("z", 0))
 
+                        # Squared distance for filtering and ordering;
+                        # the sqrt is taken only for returned entries
                         dx = x - current_x
                         dy = y - current_y
                         dz = z - current_z
-                        distance = (dx * dx + dy * dy + dz * dz) ** 0.5
+                        d2 = dx * dx + dy * dy + dz * dz
 
                         unclaimed_systems.append({
                             "systems": system_name,  # Match UI_main.py field name
@@ -294,7 +462,7 @@ class SystemRepository:
                             "x": x,
                             "y": y,
                             "z": z,
-                            "distance": distance
+                            "distance": d2
                         })
                     except (ValueError, TypeError) as e:
                         print(f"[ERROR] Error processing coordinates for system {system_name}: {e}")
@@ -303,8 +471,18 @@ class SystemRepository:
                     print(f"[ERROR] Error processing system: {e}")
                     continue
 
-            # Sort by distance
-            unclaimed_systems.sort(key=lambda x: x["distance"])
+            # Sort by (squared) distance; with a limit, a partial heap
+            # selection avoids sorting candidates that would be cut anyway
+            if limit is not None:
+                unclaimed_systems = heapq.nsmallest(
+                    limit, unclaimed_systems, key=lambda x: x["distance"]
+                )
+            else:
+                unclaimed_systems.sort(key=lambda x: x["distance"])
+
+            # Convert the survivors' squared distances to real ones
+            for entry in unclaimed_systems:
+                entry["distance"] = entry["distance"] ** 0.5
             return unclaimed_systems
         except Exception as e:
             print(f"[ERROR] Error getting unclaimed systems: {e}")
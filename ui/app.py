@@ -147,6 +147,11 @@ class App(ctk.CTk):
         # Auto-setup journals
         self._auto_setup_journals()
 
+        # Start the shared background task queue before any screens are
+        # built, so they can submit work from their constructors
+        from utils.threading_utils import init_task_queue
+        init_task_queue(self)
+
         # Initialize UI
         self._initialize_ui()
 
@@ -603,6 +608,15 @@ class App(ctk.CTk):
             # Stop journal monitoring
             self.journal_manager.stop_monitoring()
 
+            # Stop the shared task queue and drop any queued work
+            try:
+                from utils.threading_utils import get_task_queue
+                task_queue = get_task_queue()
+                if task_queue is not None:
+                    task_queue.stop()
+            except Exception as e:
+                print(f"[WARNING] Error stopping task queue: {e}")
+
             # Set stop event
             self._stop_event.set()
 
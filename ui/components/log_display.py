@@ -48,11 +48,13 @@ class StdoutRedirector(io.StringIO):
 class LogDisplay(ctk.CTkFrame):
     """Component for displaying log messages."""
 
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, max_lines: int = 1000, **kwargs):
         """Initialize the log display.
 
         Args:
             parent: The parent widget.
+            max_lines: Maximum number of lines kept in the text widget.
+                Tk text widgets slow down badly on unbounded backlogs.
             **kwargs: Additional keyword arguments for the frame.
         """
         super().__init__(parent, **kwargs)
@@ -62,9 +64,11 @@ class LogDisplay(ctk.CTkFrame):
 
         # Initialize variables
         self.log_buffer = []
-        self.max_buffer_size = 1000
+        self.max_buffer_size = max_lines
+        self.max_lines = max_lines
         self.auto_scroll = True
         self.redirector = None
+        self._trim_scheduled = False
 
         # Start log capture
         self._start_capture()
@@ -118,6 +122,12 @@ class LogDisplay(ctk.CTkFrame):
         )
         self.log_text.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
 
+        # Configure tags for colored text (once; tags persist)
+        self.log_text.tag_config("error", foreground="#E74C3C")
+        self.log_text.tag_config("warning", foreground="#F39C12")
+        self.log_text.tag_config("debug", foreground="#3498DB")
+        self.log_text.tag_config("info", foreground="#4ECDC4")
+
         # Make text widget read-only
         self.log_text.configure(state="disabled")
 
@@ -152,37 +162,83 @@ class LogDisplay(ctk.CTkFrame):
         if len(self.log_buffer) > self.max_buffer_size:
             self.log_buffer = self.log_buffer[-self.max_buffer_size:]
 
-        # Update display
-        self._update_display()
+        # Append just the new message; the backlog is already rendered
+        self._append_message(message)
+
+    @staticmethod
+    def _tag_for(message: str):
+        """Get the color tag for a message, based on its level prefix.
+
+        Args:
+            message: The log message.
+
+        Returns:
+            Optional[str]: The tag name, or None for untagged text.
+        """
+        if "[ERROR]" in message:
+            return "error"
+        elif "[WARNING]" in message:
+            return "warning"
+        elif "[DEBUG]" in message:
+            return "debug"
+        elif "[INFO]" in message:
+            return "info"
+        return None
+
+    def _append_message(self, message: str):
+        """Append a single message to the text widget.
+
+        Args:
+            message: The log message.
+        """
+        self.log_text.configure(state="normal")
+
+        tag = self._tag_for(message)
+        if tag:
+            self.log_text.insert("end", message, (tag,))
+        else:
+            self.log_text.insert("end", message)
+
+        # Auto-scroll to end if enabled
+        if self.auto_scroll:
+            self.log_text.see("end")
+
+        self.log_text.configure(state="disabled")
+
+        # Batch overflow deletion via after_idle so a burst of inserts
+        # pays for at most one trim
+        if not self._trim_scheduled:
+            self._trim_scheduled = True
+            self.after_idle(self._trim_overflow)
+
+    def _trim_overflow(self):
+        """Delete lines beyond max_lines from the top of the widget."""
+        self._trim_scheduled = False
+        try:
+            total_lines = int(self.log_text.index("end-1c").split(".")[0])
+            if total_lines > self.max_lines:
+                self.log_text.configure(state="normal")
+                self.log_text.delete("1.0", f"{total_lines - self.max_lines + 1}.0")
+                self.log_text.configure(state="disabled")
+        except Exception:
+            pass
 
     def _update_display(self):
-        """Update the log display."""
+        """Rebuild the log display from the buffer."""
         # Enable text widget for editing
         self.log_text.configure(state="normal")
 
         # Clear current content
         self.log_text.delete("1.0", "end")
 
-        # Add all messages from buffer
+        # Add all messages from buffer, color-coded by level
         for message in self.log_buffer:
-            # Color-code messages based on level
-            if "[ERROR]" in message:
-                self.log_text.insert("end", message, ("error",))
-            elif "[WARNING]" in message:
-                self.log_text.insert("end", message, ("warning",))
-            elif "[DEBUG]" in message:
-                self.log_text.insert("end", message, ("debug",))
-            elif "[INFO]" in message:
-                self.log_text.insert("end", message, ("info",))
+            tag = self._tag_for(message)
+            if tag:
+                self.log_text.insert("end", message, (tag,))
             else:
                 self.log_text.insert("end", message)
 
-        # Configure tags for colored text
-        self.log_text.tag_config("error", foreground="#E74C3C")
-        self.log_text.tag_config("warning", foreground="#F39C12")
-        self.log_text.tag_config("debug", foreground="#3498DB")
-        self.log_text.tag_config("info", foreground="#4ECDC4")
-
         # Auto-scroll to end if enabled
         if self.auto_scroll:
             self.log_text.see("end")
@@ -4,9 +4,28 @@ Confirms journal folder and selects primary commander.
 """
 
 import os
+import tkinter as tk
 import customtkinter as ctk
 from typing import Dict, Any, Optional, List
 
+# Fixed height of a commander row on the canvas
+ROW_H = 72
+
+# Row count above which the commanders list needs a scrollbar
+MAX_UNSCROLLED_ROWS = 4
+
+# Row layout, resolved once at import time instead of per-row
+CARD_PADX = 5
+CARD_PADY = 3
+CARD_RIGHT = 555
+RADIO_CX = 28
+RADIO_R = 8
+DOT_R = 4
+TEXT_X = 50
+NAME_DY = 18
+STATS_DY = 40
+PRIMARY_DY = 58
+
 
 try:
     DialogBaseClass = ctk.CTkToplevel
@@ -34,21 +53,39 @@ class JournalConfirmationDialog(DialogBaseClass):
         self.analysis_data = analysis_data
         self.is_verification = is_verification
         self.result = False
-        self.selected_commander = None
+
+        # Unpack the fixed analysis payload once instead of repeating
+        # dict lookups in setup_ui and get_primary_commander
+        self._commanders = analysis_data.get("commanders", {})
+        self._primary = analysis_data.get("primary_commander", "")
+        self._folder_path = analysis_data.get("folder_path", "Unknown")
+
+        self.selected_commander = self._primary or None
+
+        # Create a single selection variable shared by every radio button.
+        # Sharing one variable lets tk maintain radio-group exclusivity
+        # internally instead of syncing N independent variables.
+        try:
+            self.selection_var = ctk.StringVar(master=self, value=self.selected_commander or "")
+        except (AttributeError, TypeError):
+            # Fallback for older versions of customtkinter
+            import tkinter as tk
+            self.selection_var = tk.StringVar(master=self, value=self.selected_commander or "")
+        self.selection_var.trace_add("write", self._on_selection_changed)
 
         # Set window properties
         self.title("Journal Folder Confirmation")
-        self.geometry("600x500")
         self.resizable(False, False)
 
         # Make dialog modal
         self.transient(parent)
         self.grab_set()
 
-        # Center on parent
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
+        # Center on parent using the fixed dialog size. The size is known
+        # up front, so there is no need to flush the event queue with
+        # update_idletasks() just to read it back, and a single geometry
+        # call avoids a second WM reconfigure.
+        width, height = 600, 500
         parent_x = parent.winfo_rootx()
         parent_y = parent.winfo_rooty()
         parent_width = parent.winfo_width()
@@ -69,11 +106,8 @@ class JournalConfirmationDialog(DialogBaseClass):
         Returns:
             str: The selected commander name.
         """
-        if self.selected_commander:
-            return self.selected_commander
-
         # If no commander is explicitly selected, use the one from analysis
-        return self.analysis_data.get("primary_commander", "Unknown")
+        return self.selected_commander or self._primary or "Unknown"
 
     def setup_ui(self):
         """Set up the UI components."""
@@ -96,81 +130,85 @@ class JournalConfirmationDialog(DialogBaseClass):
         self.title_label.pack(pady=(0, 10))
 
         # Create folder path label
-        folder_path = self.analysis_data.get("folder_path", "Unknown")
         self.folder_label = ctk.CTkLabel(
             self.main_frame,
-            text=f"Folder: {folder_path}",
+            text=f"Folder: {self._folder_path}",
             font=("Segoe UI", 12),
             text_color="#B0B0B0"
         )
         self.folder_label.pack(pady=(0, 20))
 
-        # Create commanders frame
-        try:
-            self.commanders_frame = ctk.CTkScrollableFrame(
-                self.main_frame,
-                width=500,
-                height=250,
-                label_text="Detected Commanders",
-                label_font=("Segoe UI", 14, "bold")
-            )
-        except (AttributeError, TypeError):
-            # Fallback for older versions of customtkinter
-            import tkinter as tk
-            self.commanders_frame_label = tk.Label(
-                self.main_frame,
-                text="Detected Commanders",
-                font=("Segoe UI", 14, "bold"),
-                background="#1a1a1a",
-                foreground="#FFFFFF"
-            )
-            self.commanders_frame_label.pack(anchor="w", pady=(0, 5))
-
-            self.commanders_frame_container = tk.Frame(self.main_frame, background="#1a1a1a")
-            self.commanders_frame_container.pack(fill="both", expand=True, pady=(0, 20))
-
-            self.commanders_frame_canvas = tk.Canvas(
-                self.commanders_frame_container,
-                background="#1a1a1a",
-                highlightthickness=0
-            )
-            self.commanders_frame_scrollbar = tk.Scrollbar(
-                self.commanders_frame_container,
+        # Create commanders list label
+        self.commanders_label = ctk.CTkLabel(
+            self.main_frame,
+            text="Detected Commanders",
+            font=("Segoe UI", 14, "bold"),
+            text_color="#FFFFFF"
+        )
+        self.commanders_label.pack(anchor="w", pady=(0, 5))
+
+        # Draw all commander rows on a single canvas instead of building a
+        # widget tree per card, so scrolling and resizing cost scales with
+        # visible pixels rather than widget count
+        # Only pay for a scrollbar when the rows cannot all fit; the
+        # common case is 2-3 commanders, which needs no scrolling at all
+        scrollable = len(self._commanders) > MAX_UNSCROLLED_ROWS
+        list_height = (MAX_UNSCROLLED_ROWS if scrollable else len(self._commanders)) * ROW_H
+
+        # Fix the container height and stop geometry propagation so row
+        # redraws and font-metric changes can never cascade a relayout up
+        # through main_frame
+        self.cmdr_container = tk.Frame(self.main_frame, background="#1a1a1a", height=list_height)
+        self.cmdr_container.pack_propagate(False)
+        self.cmdr_container.pack(fill="x", pady=(0, 20))
+
+        self.cmdr_canvas = tk.Canvas(
+            self.cmdr_container,
+            background="#1a1a1a",
+            highlightthickness=0,
+            height=list_height
+        )
+        if scrollable:
+            self.cmdr_scrollbar = tk.Scrollbar(
+                self.cmdr_container,
                 orient="vertical",
-                command=self.commanders_frame_canvas.yview
+                command=self.cmdr_canvas.yview
             )
-            self.commanders_frame = tk.Frame(self.commanders_frame_canvas, background="#1a1a1a")
-
-            self.commanders_frame.bind(
-                "<Configure>",
-                lambda e: self.commanders_frame_canvas.configure(
-                    scrollregion=self.commanders_frame_canvas.bbox("all")
-                )
-            )
-
-            self.commanders_frame_canvas.create_window((0, 0), window=self.commanders_frame, anchor="nw")
-            self.commanders_frame_canvas.configure(yscrollcommand=self.commanders_frame_scrollbar.set)
-
-            self.commanders_frame_canvas.pack(side="left", fill="both", expand=True)
-            self.commanders_frame_scrollbar.pack(side="right", fill="y")
-        else:
-            self.commanders_frame.pack(fill="both", expand=True, pady=(0, 20))
-
-        # Add commander cards
-        commanders = self.analysis_data.get("commanders", {})
-        primary_commander = self.analysis_data.get("primary_commander", "")
-
-        # Sort commanders by count (most frequent first)
-        sorted_commanders = sorted(
-            commanders.items(),
-            key=lambda x: (x[1]["count"], x[1]["latest_time"]),
-            reverse=True
-        )
-
-        # Create a card for each commander
+            self.cmdr_canvas.configure(yscrollcommand=self.cmdr_scrollbar.set)
+            self.cmdr_scrollbar.pack(side="right", fill="y")
+            # A raw canvas has no built-in wheel scrolling, unlike the
+            # scrollable frame it replaced; <MouseWheel> covers Windows
+            # and macOS, Button-4/5 covers X11
+            self.cmdr_canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+            self.cmdr_canvas.bind("<Button-4>", self._on_mouse_wheel)
+            self.cmdr_canvas.bind("<Button-5>", self._on_mouse_wheel)
+        self.cmdr_canvas.pack(side="left", fill="both", expand=True)
+
+        # Sort commanders by count (most frequent first). Decorate-sort-
+        # undecorate builds each key tuple exactly once instead of doing
+        # two dict lookups per comparison; negating the numeric fields
+        # replaces reverse=True with plain ascending tuple comparison.
+        keyed = [
+            ((-data["count"], -data["latest_time"]), name, data)
+            for name, data in self._commanders.items()
+        ]
+        keyed.sort()
+        sorted_commanders = [(name, data) for _, name, data in keyed]
+
+        # Draw a row for each commander and remember the row order for
+        # click handling. Exactly one row is the primary commander, so
+        # dispatch up front instead of re-checking is_primary inside the
+        # row-drawing code.
+        self._card_names = [name for name, _ in sorted_commanders]
         for i, (cmdr_name, cmdr_data) in enumerate(sorted_commanders):
-            is_primary = cmdr_name == primary_commander
-            self.create_commander_card(self.commanders_frame, cmdr_name, cmdr_data, is_primary)
+            if cmdr_name == self._primary:
+                self._draw_primary_card(i, cmdr_name, cmdr_data)
+            else:
+                self._draw_secondary_card(i, cmdr_name, cmdr_data)
+
+        if scrollable:
+            self.cmdr_canvas.configure(scrollregion=(0, 0, 0, len(sorted_commanders) * ROW_H))
+        self.cmdr_canvas.bind("<Button-1>", self._on_canvas_click)
 
         # Create buttons frame
         try:
@@ -227,134 +265,148 @@ class JournalConfirmationDialog(DialogBaseClass):
             )
         self.choose_button.pack(side="right", padx=5)
 
-    def create_commander_card(self, parent, cmdr_name: str, cmdr_data: Dict[str, Any], is_primary: bool = False):
-        """Create a commander card.
+    def _format_latest_time(self, latest_time) -> str:
+        """Format a commander's latest journal timestamp.
+
+        Args:
+            latest_time: The timestamp from the commander data.
+
+        Returns:
+            str: The formatted timestamp.
+        """
+        try:
+            import datetime
+            return datetime.datetime.fromtimestamp(latest_time).strftime("%Y-%m-%d %H:%M:%S")
+        except Exception as e:
+            print(f"[ERROR] Error formatting timestamp: {e}")
+            return "Unknown"
+
+    def _draw_row_base(self, idx: int, cmdr_name: str, cmdr_data: Dict[str, Any],
+                       outline: str, name_fill: str, dot_fill: str):
+        """Draw the parts shared by every commander row.
 
         Args:
-            parent: The parent widget.
+            idx: The row index.
             cmdr_name: The commander name.
             cmdr_data: The commander data.
-            is_primary: Whether this is the primary commander.
+            outline: The card outline color.
+            name_fill: The commander name color.
+            dot_fill: The radio dot color ("" for unselected).
         """
-        # Import tkinter for fallback
-        import tkinter as tk
+        y = idx * ROW_H
+        tag = f"card{idx}"
+
+        # Draw card background
+        self.cmdr_canvas.create_rectangle(
+            CARD_PADX, y + CARD_PADY, CARD_RIGHT, y + ROW_H - CARD_PADY,
+            fill="#1f1f1f",
+            outline=outline,
+            tags=(tag,)
+        )
 
-        # Create card frame
-        try:
-            card = ctk.CTkFrame(parent, corner_radius=10)
-        except (AttributeError, TypeError):
-            card = tk.Frame(parent, background="#1f1f1f", borderwidth=1, relief="solid")
-        card.pack(fill="x", padx=10, pady=5)
+        # Draw radio circle with a per-row dot toggled on selection
+        cy = y + ROW_H // 2
+        self.cmdr_canvas.create_oval(
+            RADIO_CX - RADIO_R, cy - RADIO_R, RADIO_CX + RADIO_R, cy + RADIO_R,
+            outline="#FF7F50",
+            width=2,
+            fill="#1f1f1f",
+            tags=(tag,)
+        )
+        self.cmdr_canvas.create_oval(
+            RADIO_CX - DOT_R, cy - DOT_R, RADIO_CX + DOT_R, cy + DOT_R,
+            fill=dot_fill,
+            outline="",
+            tags=(tag, "radio_dot", f"dot{idx}")
+        )
 
-        # Create selection variable
-        try:
-            var = ctk.StringVar(value=cmdr_name if is_primary else "")
-        except (AttributeError, TypeError):
-            var = tk.StringVar(value=cmdr_name if is_primary else "")
+        # Draw commander name
+        self.cmdr_canvas.create_text(
+            TEXT_X, y + NAME_DY,
+            anchor="w",
+            text=cmdr_name,
+            font=("Segoe UI", 16, "bold"),
+            fill=name_fill,
+            tags=(tag,)
+        )
 
-        # Create radio button
-        try:
-            radio = ctk.CTkRadioButton(
-                card,
-                text="",
-                variable=var,
-                value=cmdr_name,
-                command=lambda: self.select_commander(cmdr_name)
-            )
-        except (AttributeError, TypeError):
-            radio = tk.Radiobutton(
-                card,
-                text="",
-                variable=var,
-                value=cmdr_name,
-                command=lambda: self.select_commander(cmdr_name),
-                background="#1f1f1f",
-                foreground="#FFFFFF",
-                selectcolor="#1f1f1f",
-                activebackground="#1f1f1f",
-                activeforeground="#FFFFFF"
-            )
-        radio.pack(side="left", padx=10)
+        # Draw commander stats
+        count = cmdr_data.get("count", 0)
+        latest_time_str = self._format_latest_time(cmdr_data.get("latest_time", 0))
+        self.cmdr_canvas.create_text(
+            TEXT_X, y + STATS_DY,
+            anchor="w",
+            text=f"Occurrences: {count}  |  Last seen: {latest_time_str}",
+            font=("Segoe UI", 12),
+            fill="#B0B0B0",
+            tags=(tag,)
+        )
 
-        # Set as selected if primary
-        if is_primary:
-            radio.select()
-            self.selected_commander = cmdr_name
+    def _draw_primary_card(self, idx: int, cmdr_name: str, cmdr_data: Dict[str, Any]):
+        """Draw the primary commander row (highlighted, pre-selected).
 
-        # Create info frame
-        try:
-            info_frame = ctk.CTkFrame(card, fg_color="transparent")
-        except (AttributeError, TypeError):
-            info_frame = tk.Frame(card, background="#1f1f1f")
-        info_frame.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+        Args:
+            idx: The row index.
+            cmdr_name: The commander name.
+            cmdr_data: The commander data.
+        """
+        self._draw_row_base(idx, cmdr_name, cmdr_data,
+                            outline="#FF7F50", name_fill="#FF7F50", dot_fill="#FF7F50")
+
+        # Draw primary indicator
+        self.cmdr_canvas.create_text(
+            TEXT_X, idx * ROW_H + PRIMARY_DY,
+            anchor="w",
+            text="Primary Commander (Most Frequent)",
+            font=("Segoe UI", 12, "italic"),
+            fill="#4ECDC4",
+            tags=(f"card{idx}",)
+        )
 
-        # Create commander name label
-        try:
-            name_label = ctk.CTkLabel(
-                info_frame,
-                text=cmdr_name,
-                font=("Segoe UI", 16, "bold"),
-                text_color="#FF7F50" if is_primary else "#FFFFFF"
-            )
-        except (AttributeError, TypeError):
-            name_label = tk.Label(
-                info_frame,
-                text=cmdr_name,
-                font=("Segoe UI", 16, "bold"),
-                foreground="#FF7F50" if is_primary else "#FFFFFF",
-                background="#1f1f1f"
-            )
-        name_label.pack(anchor="w")
+    def _draw_secondary_card(self, idx: int, cmdr_name: str, cmdr_data: Dict[str, Any]):
+        """Draw a non-primary commander row.
 
-        # Create commander stats label
-        count = cmdr_data.get("count", 0)
-        latest_file = cmdr_data.get("latest_file", "")
-        latest_time = cmdr_data.get("latest_time", 0)
+        Args:
+            idx: The row index.
+            cmdr_name: The commander name.
+            cmdr_data: The commander data.
+        """
+        self._draw_row_base(idx, cmdr_name, cmdr_data,
+                            outline="#333333", name_fill="#FFFFFF", dot_fill="")
 
-        # Format latest time
-        try:
-            import datetime
-            latest_time_str = datetime.datetime.fromtimestamp(latest_time).strftime("%Y-%m-%d %H:%M:%S")
-        except Exception as e:
-            print(f"[ERROR] Error formatting timestamp: {e}")
-            latest_time_str = "Unknown"
+    def _on_canvas_click(self, event):
+        """Handle a click on the commanders canvas.
 
-        # Create stats label
-        try:
-            stats_label = ctk.CTkLabel(
-                info_frame,
-                text=f"Occurrences: {count}  |  Last seen: {latest_time_str}",
-                font=("Segoe UI", 12),
-                text_color="#B0B0B0"
-            )
-        except (AttributeError, TypeError):
-            stats_label = tk.Label(
-                info_frame,
-                text=f"Occurrences: {count}  |  Last seen: {latest_time_str}",
-                font=("Segoe UI", 12),
-                foreground="#B0B0B0",
-                background="#1f1f1f"
-            )
-        stats_label.pack(anchor="w")
-
-        # Create primary indicator if primary
-        if is_primary:
-            try:
-                primary_label = ctk.CTkLabel(
-                    info_frame,
-                    text="Primary Commander (Most Frequent)",
-                    font=("Segoe UI", 12, "italic"),
-                    text_color="#4ECDC4"
-                )
-            except (AttributeError, TypeError):
-                primary_label = tk.Label(
-                    info_frame,
-                    text="Primary Commander (Most Frequent)",
-                    font=("Segoe UI", 12, "italic"),
-                    foreground="#4ECDC4",
-                    background="#1f1f1f"
-                )
-            primary_label.pack(anchor="w")
+        Args:
+            event: The click event.
+        """
+        idx = int(self.cmdr_canvas.canvasy(event.y) // ROW_H)
+        if 0 <= idx < len(self._card_names):
+            self.select_commander(self._card_names[idx])
+
+    def _on_mouse_wheel(self, event):
+        """Scroll the commanders canvas with the mouse wheel.
+
+        Args:
+            event: The wheel event; direction comes from event.delta on
+                Windows/macOS and from Button-4/Button-5 on X11.
+        """
+        if event.num == 4 or event.delta > 0:
+            self.cmdr_canvas.yview_scroll(-1, "units")
+        elif event.num == 5 or event.delta < 0:
+            self.cmdr_canvas.yview_scroll(1, "units")
+
+    def _on_selection_changed(self, *args):
+        """Handle a change of the shared selection variable."""
+        self.selected_commander = self.selection_var.get()
+
+        # Move the radio dot to the selected row (single itemconfigure per
+        # state change instead of per-widget updates)
+        canvas = getattr(self, "cmdr_canvas", None)
+        if canvas is not None and self.selected_commander in self._card_names:
+            canvas.itemconfigure("radio_dot", fill="")
+            idx = self._card_names.index(self.selected_commander)
+            canvas.itemconfigure(f"dot{idx}", fill="#FF7F50")
 
     def select_commander(self, cmdr_name: str):
         """Select a commander.
@@ -362,7 +414,7 @@ class JournalConfirmationDialog(DialogBaseClass):
         Args:
             cmdr_name: The commander name.
         """
-        self.selected_commander = cmdr_name
+        self.selection_var.set(cmdr_name)
 
     def confirm_folder(self):
         """Confirm the journal folder."""
@@ -4,14 +4,280 @@ Contains tabs for different functionality.
 """
 
 import os
+import time
+import random
+import queue
+import functools
+import tkinter as tk
 import customtkinter as ctk
+from tkinter import messagebox
 from typing import Dict, Any, Optional, List, Callable
 from ui.components.log_display import LogDisplay
+from utils.threading_utils import BackgroundTask, get_task_queue
+
+# Pseudo-category meaning "no category filter"
+ALL_CATEGORIES = "All Categories"
+
+# Shared palette
+ACCENT = "#FF7F50"
+TEXT_MAIN = "#FFFFFF"
+TEXT_DIM = "#B0B0B0"
+TEXT_MUTED = "#808080"
+
+# How long the category list is served from cache (seconds)
+CATEGORY_CACHE_TTL = 60.0
+
+# Hidden result cards kept around for reuse between searches
+CARD_POOL_MAX = 50
+
+# How many nearest unclaimed systems to fetch for prev/next navigation
+UNCLAIMED_LIMIT = 20
+
+# Cached annulus queries kept per (system, r_min, r_max) key
+NEIGHBOR_CACHE_MAX = 8
+
+# Result-list virtualization: above this many results, cards are placed
+# at fixed slots and only the visible window is rendered
+VIRTUAL_THRESHOLD = 30
+CARD_ROW_H = 140
+VIRTUAL_BUFFER = 3
+
+
+def _set_text(widget, text: str):
+    """Configure a widget's text only when it actually changed.
+
+    Args:
+        widget: The widget to update.
+        text: The new text.
+
+    Each configure call crosses into Tcl and schedules a redraw, and
+    most journal events re-report unchanged values, so diffing first
+    is cheaper than configuring unconditionally.
+    """
+    if widget.cget("text") != text:
+        widget.configure(text=text)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_search(system_repo, search_text: str):
+    """Look up systems for a search query, memoizing repeat queries.
+
+    Args:
+        system_repo: The system repository (hashed by identity, so the
+            cache naturally invalidates if the repository is swapped).
+        search_text: The query string.
+
+    Returns:
+        tuple: (exact_match_or_None, tuple_of_partial_matches).
+
+    Errors from the repository propagate uncached, so transient
+    failures are never served as stale results.
+    """
+    system = system_repo.get_by_name(search_text)
+    if system:
+        return system, ()
+    return None, tuple(system_repo.get_by_filter({"name": search_text}))
+
+
+class SystemCard:
+    """A reusable search-result card whose labels are updated in place.
+
+    Creating Tk widgets is far more expensive than reconfiguring them,
+    so cards are pooled: a search updates existing cards via configure
+    and hides any leftovers instead of destroying and rebuilding.
+    """
+
+    def __init__(self, parent, view_command: Callable, claim_command: Callable):
+        """Initialize the card widgets.
+
+        Args:
+            parent: The parent widget (the systems frame).
+            view_command: Callback invoked with the system on View.
+            claim_command: Callback invoked with the system on Claim.
+        """
+        self.system = None
+
+        # Result index this card is placed at in virtualized mode,
+        # or None when the card is packed (or hidden)
+        self.row = None
+
+        # Create card frame
+        self.card = ctk.CTkFrame(parent, corner_radius=10)
+        self.card.grid_columnconfigure(1, weight=1)
+
+        # Create system name
+        self.name_label = ctk.CTkLabel(
+            self.card,
+            text="",
+            font=MainScreen.FONT_CARD_BOLD,
+            text_color=TEXT_MAIN
+        )
+        self.name_label.grid(row=0, column=0, columnspan=2, padx=15, pady=(15, 5), sticky="w")
+
+        # Create categories
+        self.categories_label = ctk.CTkLabel(
+            self.card,
+            text="",
+            font=MainScreen.FONT_BODY,
+            text_color=TEXT_DIM
+        )
+
+        # Create coordinates
+        self.coords_label = ctk.CTkLabel(
+            self.card,
+            text="",
+            font=MainScreen.FONT_BODY,
+            text_color=TEXT_MUTED
+        )
+        self.coords_label.grid(row=2, column=0, columnspan=2, padx=15, pady=(0, 15), sticky="w")
+
+        # Create view button
+        self.view_button = ctk.CTkButton(
+            self.card,
+            text="View",
+            font=MainScreen.FONT_BODY,
+            width=80,
+            height=30,
+            command=lambda: view_command(self.system)
+        )
+        self.view_button.grid(row=3, column=0, padx=(15, 5), pady=(0, 15), sticky="w")
+
+        # Create claim button and claimed label; update() shows one of them
+        self.claim_button = ctk.CTkButton(
+            self.card,
+            text="Claim",
+            font=MainScreen.FONT_BODY,
+            width=80,
+            height=30,
+            command=lambda: claim_command(self.system)
+        )
+        self.claimed_label = ctk.CTkLabel(
+            self.card,
+            text="",
+            font=MainScreen.FONT_BODY,
+            text_color=TEXT_MUTED
+        )
+
+    def update(self, system):
+        """Point the card at a system and refresh its labels.
+
+        Args:
+            system: The system to display.
+        """
+        # A card showing the same (name, commander) snapshot is already
+        # rendered correctly — skip the label reconfigures entirely.
+        # Commander is part of the key because it decides which of the
+        # claim button / claimed-by label is shown.
+        previous = self.system
+        self.system = system
+        if (
+            previous is not None
+            and previous.name == system.name
+            and previous.commander == system.commander
+        ):
+            return
+
+        self.name_label.configure(text=system.name)
+
+        # Update categories (formatted once per system, see the model)
+        if system.categories:
+            self.categories_label.configure(text=system.display_categories)
+            self.categories_label.grid(row=1, column=0, columnspan=2, padx=15, pady=(0, 5), sticky="w")
+        else:
+            self.categories_label.grid_remove()
+
+        # Update coordinates
+        self.coords_label.configure(text=system.display_coords)
+
+        # Show claim button for unclaimed systems, claimed-by label otherwise
+        if not system.commander:
+            self.claimed_label.grid_remove()
+            self.claim_button.grid(row=3, column=1, padx=(5, 15), pady=(0, 15), sticky="e")
+        else:
+            self.claim_button.grid_remove()
+            self.claimed_label.configure(text=f"Claimed by: {system.commander}")
+            self.claimed_label.grid(row=3, column=1, padx=(5, 15), pady=(0, 15), sticky="e")
+
+    def show(self):
+        """Pack the card into its parent."""
+        self.card.pack(fill="x", padx=10, pady=10)
+
+    def hide(self):
+        """Remove the card from layout without destroying it."""
+        self.card.pack_forget()
+
+    def place_at(self, row: int):
+        """Place the card at a fixed-height slot for the given result index.
+
+        place() repositions in O(1) without relayout of siblings, which
+        is what makes scrolling through a virtualized list cheap.
+
+        Args:
+            row: The result index whose slot the card should occupy.
+        """
+        self.row = row
+        self.card.place(
+            x=10,
+            y=row * CARD_ROW_H + 5,
+            relwidth=1.0,
+            width=-20,
+            height=CARD_ROW_H - 10
+        )
+
+    def unplace(self):
+        """Remove a virtualized card from layout without destroying it."""
+        self.card.place_forget()
+        self.row = None
 
 
 class MainScreen(ctk.CTkFrame):
     """Main screen with tabs for different functionality."""
 
+    # Shared CTkFont objects, created once per process by _init_fonts().
+    # Reusing them avoids re-parsing a font tuple into a Tk font for
+    # every widget built during card-creation bursts.
+    FONT_SMALL = None
+    FONT_SMALL_BOLD = None
+    FONT_BODY = None
+    FONT_BODY_BOLD = None
+    FONT_HEADING = None
+    FONT_HEADING_BOLD = None
+    FONT_CARD_BOLD = None
+    FONT_TITLE_BOLD = None
+    FONT_LARGE_BOLD = None
+    FONT_VALUE_BOLD = None
+    FONT_DIST = None
+    FONT_ICON = None
+
+    # Galaxy-tab stat cards: (title, value, icon, color, row, col)
+    _STAT_CARDS = (
+        ("Total Systems", "0", "🌌", "#3498DB", 0, 0),
+        ("Your Claims", "0", "🚩", "#E74C3C", 0, 1),
+        ("Session Time", "00:00:00", "⏱️", "#F39C12", 0, 2),
+        ("Visited Systems", "0", "✅", "#4ECDC4", 1, 0),
+        ("Unclaimed Systems", "0", "🔍", "#9B59B6", 1, 1),
+        ("Total Categories", "0", "🏷️", "#FF7F50", 1, 2),
+    )
+
+    @classmethod
+    def _init_fonts(cls):
+        """Create the shared fonts (requires a Tk root to exist)."""
+        if cls.FONT_BODY is not None:
+            return
+
+        cls.FONT_SMALL = ctk.CTkFont("Segoe UI", 10)
+        cls.FONT_SMALL_BOLD = ctk.CTkFont("Segoe UI", 10, "bold")
+        cls.FONT_BODY = ctk.CTkFont("Segoe UI", 12)
+        cls.FONT_BODY_BOLD = ctk.CTkFont("Segoe UI", 12, "bold")
+        cls.FONT_HEADING = ctk.CTkFont("Segoe UI", 14)
+        cls.FONT_HEADING_BOLD = ctk.CTkFont("Segoe UI", 14, "bold")
+        cls.FONT_CARD_BOLD = ctk.CTkFont("Segoe UI", 16, "bold")
+        cls.FONT_TITLE_BOLD = ctk.CTkFont("Segoe UI", 18, "bold")
+        cls.FONT_LARGE_BOLD = ctk.CTkFont("Segoe UI", 20, "bold")
+        cls.FONT_VALUE_BOLD = ctk.CTkFont("Segoe UI", 24, "bold")
+        cls.FONT_DIST = ctk.CTkFont("Segoe UI", 16)
+        cls.FONT_ICON = ctk.CTkFont("Segoe UI", 36)
+
     def __init__(self, parent):
         """Initialize the main screen.
 
@@ -20,6 +286,9 @@ class MainScreen(ctk.CTkFrame):
         """
         super().__init__(parent, corner_radius=0)
 
+        # Create the shared fonts before any child widget needs them
+        self._init_fonts()
+
         # Store parent reference
         self.app = parent
 
@@ -32,6 +301,42 @@ class MainScreen(ctk.CTkFrame):
         self.is_admin = getattr(parent, 'is_admin', False)
         self.map_window = None
 
+        # Error messages from hot handlers go through a queue drained
+        # every 100ms on the main thread, so a burst of journal errors
+        # never stalls the handler itself on stdout flushes
+        self._log_q = queue.Queue()
+        self.after(100, self._drain_log_queue)
+
+        # Persistent nearest-unclaimed popup, built on first use
+        self._unclaimed_popup = None
+        self._unclaimed_current = None
+
+        # Unclaimed-system navigation state; initialized here so the
+        # arrow handlers test plain attributes instead of hasattr
+        self.unclaimed_systems: List[Dict[str, Any]] = []
+        self.unclaimed_index: int = 0
+        self._unclaimed_display: List[tuple] = []
+
+        # Pending current-system update (coalesced via after_idle)
+        self._pending_system = None
+        self._system_update_scheduled = False
+
+        # Cached annulus-query results keyed (system, r_min, r_max),
+        # so repeated Random System clicks skip the repository scan
+        self._neighbor_cache: Dict[tuple, tuple] = {}
+
+        # Initialize optional widgets/state up front so handlers can use
+        # plain None checks instead of hasattr probes
+        self.admin_badge = None
+        self.filters_panel = None
+        self.selected_categories = {ALL_CATEGORIES}
+
+        # Cached (timestamp, categories) for the filter panel, plus the
+        # hash of the last category list the checkboxes were built for
+        self._cat_cache = None
+        self._cat_hash = None
+        self._category_checkboxes = []
+
         # Set up UI
         self._setup_ui()
 
@@ -53,14 +358,30 @@ class MainScreen(ctk.CTkFrame):
         self.tab_galaxy = self.tabview.add("Galaxy")
         self.tab_info = self.tabview.add("Info")
 
-        # Set up tabs
+        # Build only the default tab eagerly; Galaxy and Info stay empty
+        # frames until first visited, cutting cold-start widget count
+        self._tab_built = {"Main": False, "Galaxy": False, "Info": False}
+        self.log_display = None
+        self.tabview.configure(command=self._on_tab_changed)
+
         self._setup_main_tab()
-        self._setup_galaxy_tab()
-        self._setup_info_tab()
+        self._tab_built["Main"] = True
 
         # Create footer frame
         self._create_footer()
 
+    def _on_tab_changed(self):
+        """Build a lazily-created tab the first time it is selected."""
+        tab_name = self.tabview.get()
+        if self._tab_built.get(tab_name):
+            return
+
+        if tab_name == "Galaxy":
+            self._setup_galaxy_tab()
+        elif tab_name == "Info":
+            self._setup_info_tab()
+        self._tab_built[tab_name] = True
+
     def _create_header(self):
         """Create the header frame."""
         # Create header frame
@@ -72,8 +393,8 @@ class MainScreen(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self.header_frame,
             text="Elite Dangerous Records Helper",
-            font=("Segoe UI", 18, "bold"),
-            text_color="#FF7F50"
+            font=MainScreen.FONT_TITLE_BOLD,
+            text_color=ACCENT
         )
         self.title_label.grid(row=0, column=0, padx=20, pady=10)
 
@@ -85,8 +406,8 @@ class MainScreen(ctk.CTkFrame):
         self.system_label = ctk.CTkLabel(
             self.system_frame,
             text="Current System:",
-            font=("Segoe UI", 12),
-            text_color="#B0B0B0"
+            font=MainScreen.FONT_BODY,
+            text_color=TEXT_DIM
         )
         self.system_label.pack(side="left", padx=(0, 5))
 
@@ -94,8 +415,8 @@ class MainScreen(ctk.CTkFrame):
         self.system_value = ctk.CTkLabel(
             self.system_frame,
             text="Unknown",
-            font=("Segoe UI", 12, "bold"),
-            text_color="#FFFFFF"
+            font=MainScreen.FONT_BODY_BOLD,
+            text_color=TEXT_MAIN
         )
         self.system_value.pack(side="left")
 
@@ -107,8 +428,8 @@ class MainScreen(ctk.CTkFrame):
         self.commander_label = ctk.CTkLabel(
             self.commander_frame,
             text="Commander:",
-            font=("Segoe UI", 12),
-            text_color="#B0B0B0"
+            font=MainScreen.FONT_BODY,
+            text_color=TEXT_DIM
         )
         self.commander_label.pack(side="left", padx=(0, 5))
 
@@ -116,8 +437,8 @@ class MainScreen(ctk.CTkFrame):
         self.commander_value = ctk.CTkLabel(
             self.commander_frame,
             text=self.app.cmdr_name,
-            font=("Segoe UI", 12, "bold"),
-            text_color="#FFFFFF"
+            font=MainScreen.FONT_BODY_BOLD,
+            text_color=TEXT_MAIN
         )
         self.commander_value.pack(side="left")
 
@@ -126,8 +447,8 @@ class MainScreen(ctk.CTkFrame):
             self.admin_badge = ctk.CTkLabel(
                 self.commander_frame,
                 text="ADMIN",
-                font=("Segoe UI", 10, "bold"),
-                text_color="#FFFFFF",
+                font=MainScreen.FONT_SMALL_BOLD,
+                text_color=TEXT_MAIN,
                 fg_color="#E74C3C",
                 corner_radius=5,
                 width=60,
@@ -146,8 +467,8 @@ class MainScreen(ctk.CTkFrame):
         self.version_label = ctk.CTkLabel(
             self.footer_frame,
             text=f"v1.4.0",
-            font=("Segoe UI", 10),
-            text_color="#808080"
+            font=MainScreen.FONT_SMALL,
+            text_color=TEXT_MUTED
         )
         self.version_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
 
@@ -155,8 +476,8 @@ class MainScreen(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self.footer_frame,
             text="Ready",
-            font=("Segoe UI", 10),
-            text_color="#808080"
+            font=MainScreen.FONT_SMALL,
+            text_color=TEXT_MUTED
         )
         self.status_label.grid(row=0, column=1, padx=10, pady=5, sticky="e")
 
@@ -176,15 +497,20 @@ class MainScreen(ctk.CTkFrame):
             placeholder_text="Search for a system...",
             width=300,
             height=35,
-            font=("Segoe UI", 12)
+            font=MainScreen.FONT_BODY
         )
         self.search_entry.pack(side="left", padx=(0, 10))
 
+        # Debounced live search: a burst of keystrokes collapses into a
+        # single lookup 300ms after the last one
+        self._search_after_id: Optional[str] = None
+        self.search_entry.bind("<KeyRelease>", self._on_search_key)
+
         # Create search button
         self.search_button = ctk.CTkButton(
             self.search_frame,
             text="Search",
-            font=("Segoe UI", 12),
+            font=MainScreen.FONT_BODY,
             width=100,
             height=35,
             command=self._search_systems
@@ -195,7 +521,7 @@ class MainScreen(ctk.CTkFrame):
         self.filter_button = ctk.CTkButton(
             self.search_frame,
             text="Filters",
-            font=("Segoe UI", 12),
+            font=MainScreen.FONT_BODY,
             width=100,
             height=35,
             command=self._toggle_filters
@@ -206,7 +532,7 @@ class MainScreen(ctk.CTkFrame):
         self.systems_frame = ctk.CTkScrollableFrame(
             self.tab_main,
             label_text="Nearby Systems",
-            label_font=("Segoe UI", 14, "bold")
+            label_font=MainScreen.FONT_HEADING_BOLD
         )
         self.systems_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
 
@@ -214,11 +540,24 @@ class MainScreen(ctk.CTkFrame):
         self.placeholder_label = ctk.CTkLabel(
             self.systems_frame,
             text="No systems found nearby.\nTry searching for a specific system.",
-            font=("Segoe UI", 14),
-            text_color="#808080"
+            font=MainScreen.FONT_HEADING,
+            text_color=TEXT_MUTED
         )
         self.placeholder_label.pack(pady=50)
 
+        # Pool of reusable result cards. The pool plus the visible-count
+        # and placeholder flags are the authoritative child state, so
+        # display updates never need winfo_children() round-trips
+        self._card_pool: List[SystemCard] = []
+        self._visible_cards = 0
+        self._placeholder_visible = True
+
+        # Virtualization state: large result sets keep all systems here
+        # and render only the scrolled-into-view slice via place()
+        self._virtual_mode = False
+        self._all_systems = []
+        self._scroll_hooked = False
+
     def _setup_galaxy_tab(self):
         """Set up the galaxy tab."""
         # Configure grid
@@ -233,7 +572,7 @@ class MainScreen(ctk.CTkFrame):
         self.open_map_button = ctk.CTkButton(
             self.galaxy_controls_frame,
             text="Open Galaxy Map",
-            font=("Segoe UI", 12),
+            font=MainScreen.FONT_BODY,
             width=150,
             height=35,
             command=self._open_galaxy_map
@@ -244,7 +583,7 @@ class MainScreen(ctk.CTkFrame):
         self.find_unclaimed_button = ctk.CTkButton(
             self.galaxy_controls_frame,
             text="Find Unclaimed",
-            font=("Segoe UI", 12),
+            font=MainScreen.FONT_BODY,
             width=150,
             height=35,
             command=self._find_unclaimed
@@ -255,7 +594,7 @@ class MainScreen(ctk.CTkFrame):
         self.random_system_button = ctk.CTkButton(
             self.galaxy_controls_frame,
             text="Random System",
-            font=("Segoe UI", 12),
+            font=MainScreen.FONT_BODY,
             width=150,
             height=35,
             command=self._random_system
@@ -271,24 +610,8 @@ class MainScreen(ctk.CTkFrame):
         self.stats_frame.grid_rowconfigure((0, 1), weight=1)
 
         # Create stat cards
-        self._create_stat_card(
-            self.stats_frame, "Total Systems", "0", "🌌", "#3498DB", 0, 0
-        )
-        self._create_stat_card(
-            self.stats_frame, "Your Claims", "0", "🚩", "#E74C3C", 0, 1
-        )
-        self._create_stat_card(
-            self.stats_frame, "Session Time", "00:00:00", "⏱️", "#F39C12", 0, 2
-        )
-        self._create_stat_card(
-            self.stats_frame, "Visited Systems", "0", "✅", "#4ECDC4", 1, 0
-        )
-        self._create_stat_card(
-            self.stats_frame, "Unclaimed Systems", "0", "🔍", "#9B59B6", 1, 1
-        )
-        self._create_stat_card(
-            self.stats_frame, "Total Categories", "0", "🏷️", "#FF7F50", 1, 2
-        )
+        for args in self._STAT_CARDS:
+            self._create_stat_card(self.stats_frame, *args)
 
     def _setup_info_tab(self):
         """Set up the info tab."""
@@ -304,8 +627,8 @@ class MainScreen(ctk.CTkFrame):
         self.info_title = ctk.CTkLabel(
             self.info_frame,
             text="About Elite Dangerous Records Helper",
-            font=("Segoe UI", 20, "bold"),
-            text_color="#FF7F50"
+            font=MainScreen.FONT_LARGE_BOLD,
+            text_color=ACCENT
         )
         self.info_title.pack(pady=(0, 20))
 
@@ -313,8 +636,8 @@ class MainScreen(ctk.CTkFrame):
         self.info_desc = ctk.CTkLabel(
             self.info_frame,
             text="Elite Dangerous Records Helper is a tool for tracking and sharing interesting star systems in Elite Dangerous.",
-            font=("Segoe UI", 14),
-            text_color="#FFFFFF",
+            font=MainScreen.FONT_HEADING,
+            text_color=TEXT_MAIN,
             wraplength=600
         )
         self.info_desc.pack(pady=(0, 20))
@@ -323,8 +646,8 @@ class MainScreen(ctk.CTkFrame):
         self.features_title = ctk.CTkLabel(
             self.info_frame,
             text="Features",
-            font=("Segoe UI", 16, "bold"),
-            text_color="#FF7F50"
+            font=MainScreen.FONT_CARD_BOLD,
+            text_color=ACCENT
         )
         self.features_title.pack(pady=(0, 10))
 
@@ -342,8 +665,8 @@ class MainScreen(ctk.CTkFrame):
             feature_label = ctk.CTkLabel(
                 self.info_frame,
                 text=f"• {feature}",
-                font=("Segoe UI", 14),
-                text_color="#FFFFFF",
+                font=MainScreen.FONT_HEADING,
+                text_color=TEXT_MAIN,
                 anchor="w"
             )
             feature_label.pack(pady=(0, 5), anchor="w")
@@ -352,8 +675,8 @@ class MainScreen(ctk.CTkFrame):
         self.credits_title = ctk.CTkLabel(
             self.info_frame,
             text="Credits",
-            font=("Segoe UI", 16, "bold"),
-            text_color="#FF7F50"
+            font=MainScreen.FONT_CARD_BOLD,
+            text_color=ACCENT
         )
         self.credits_title.pack(pady=(20, 10))
 
@@ -361,13 +684,13 @@ class MainScreen(ctk.CTkFrame):
         self.credits_text = ctk.CTkLabel(
             self.info_frame,
             text="Created by the Elite Dangerous community.\nSpecial thanks to all contributors and testers.",
-            font=("Segoe UI", 14),
-            text_color="#FFFFFF"
+            font=MainScreen.FONT_HEADING,
+            text_color=TEXT_MAIN
         )
         self.credits_text.pack(pady=(0, 20))
 
         # Create log display (bottom section)
-        self.log_display = LogDisplay(self.tab_info, height=300)
+        self.log_display = LogDisplay(self.tab_info, height=300, max_lines=1000)
         self.log_display.grid(row=1, column=0, sticky="nsew", padx=20, pady=(10, 20))
 
     def _create_stat_card(self, parent, title, value, icon, color, row, col):
@@ -390,7 +713,7 @@ class MainScreen(ctk.CTkFrame):
         icon_label = ctk.CTkLabel(
             card,
             text=icon,
-            font=("Segoe UI", 36),
+            font=MainScreen.FONT_ICON,
             text_color=color
         )
         icon_label.pack(pady=(20, 10))
@@ -399,8 +722,8 @@ class MainScreen(ctk.CTkFrame):
         value_label = ctk.CTkLabel(
             card,
             text=value,
-            font=("Segoe UI", 24, "bold"),
-            text_color="#FFFFFF"
+            font=MainScreen.FONT_VALUE_BOLD,
+            text_color=TEXT_MAIN
         )
         value_label.pack(pady=(0, 5))
 
@@ -408,8 +731,8 @@ class MainScreen(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             card,
             text=title,
-            font=("Segoe UI", 14),
-            text_color="#B0B0B0"
+            font=MainScreen.FONT_HEADING,
+            text_color=TEXT_DIM
         )
         title_label.pack(pady=(0, 20))
 
@@ -419,21 +742,78 @@ class MainScreen(ctk.CTkFrame):
     def update_current_system(self, system_name: str):
         """Update the current system display.
 
+        This fires on every system jump, so rapid journal bursts are
+        coalesced: only the latest pending name is applied, via a single
+        after_idle callback.
+
         Args:
             system_name: The current system name.
         """
-        self.system_value.configure(text=system_name)
+        self._pending_system = system_name
+        if not self._system_update_scheduled:
+            self._system_update_scheduled = True
+            self.after_idle(self._apply_pending_system)
+
+    def _apply_pending_system(self):
+        """Apply the most recent pending current-system update."""
+        self._system_update_scheduled = False
+        system_name = self._pending_system
+
+        # A jump moved the reference point, so cached neighbor queries
+        # for the old position are useless
+        self._neighbor_cache.clear()
+
+        _set_text(self.system_value, system_name)
+        _set_text(self.status_label, f"Current system: {system_name}")
+
+        # Resolve coordinates off-thread; the lookup can hit the network
+        self._submit(
+            functools.partial(self.app.system_repository.get_by_name, system_name),
+            on_complete=self._apply_current_coords,
+            on_error=self._current_coords_error
+        )
 
-        # Update status
-        self.status_label.configure(text=f"Current system: {system_name}")
+    def _submit(self, task_func, on_complete=None, on_error=None, priority=0):
+        """Run a blocking callable through the shared task queue.
 
-        # Update current coordinates
-        try:
-            system = self.app.system_repository.get_by_name(system_name)
-            if system:
-                self.current_coords = (system.x, system.y, system.z)
-        except Exception as e:
-            print(f"[ERROR] Error updating current coordinates: {e}")
+        Callbacks land back on the main thread, so handlers can touch
+        widgets directly.
+
+        Args:
+            task_func: The blocking callable to run off-thread.
+            on_complete: Called with the result on success.
+            on_error: Called with the exception on failure.
+            priority: Queue priority; 10 and above jumps the queue.
+
+        Returns:
+            BackgroundTask: The submitted task.
+        """
+        task = BackgroundTask(task_func, on_complete=on_complete, on_error=on_error)
+        task_queue = get_task_queue()
+        if task_queue is not None and task_queue.running:
+            task_queue.add_task(task, priority)
+        else:
+            # Queue not initialized (standalone screen); fall back to a
+            # per-task thread, still marshalling callbacks via the root
+            task.start(self.app)
+        return task
+
+    def _apply_current_coords(self, system):
+        """Store the resolved current-system coordinates.
+
+        Args:
+            system: The resolved system, or None if unknown.
+        """
+        if system:
+            self.current_coords = (system.x, system.y, system.z)
+
+    def _current_coords_error(self, error):
+        """Log a failed current-system coordinate lookup.
+
+        Args:
+            error: The exception raised by the lookup.
+        """
+        self._log_error(f"Error updating current coordinates: {error}")
 
     def update_commander_info(self, commander_name: str):
         """Update the commander information.
@@ -441,7 +821,7 @@ class MainScreen(ctk.CTkFrame):
         Args:
             commander_name: The commander name.
         """
-        self.commander_value.configure(text=commander_name)
+        _set_text(self.commander_value, commander_name)
 
         # Update commander name
         self.cmdr_name = commander_name
@@ -452,16 +832,20 @@ class MainScreen(ctk.CTkFrame):
         Args:
             is_admin: Whether the commander is an admin.
         """
+        # Skip the badge work entirely when the state hasn't changed
+        if is_admin == self.is_admin:
+            return
+
         # Update admin status
         self.is_admin = is_admin
 
         if is_admin:
-            if not hasattr(self, 'admin_badge'):
+            if self.admin_badge is None:
                 self.admin_badge = ctk.CTkLabel(
                     self.commander_frame,
                     text="ADMIN",
-                    font=("Segoe UI", 10, "bold"),
-                    text_color="#FFFFFF",
+                    font=MainScreen.FONT_SMALL_BOLD,
+                    text_color=TEXT_MAIN,
                     fg_color="#E74C3C",
                     corner_radius=5,
                     width=60,
@@ -469,9 +853,28 @@ class MainScreen(ctk.CTkFrame):
                 )
                 self.admin_badge.pack(side="left", padx=(5, 0))
         else:
-            if hasattr(self, 'admin_badge'):
+            if self.admin_badge is not None:
                 self.admin_badge.destroy()
-                delattr(self, 'admin_badge')
+                self.admin_badge = None
+
+    def _on_search_key(self, event=None):
+        """Debounce keystrokes in the search entry.
+
+        Each keystroke cancels the previously scheduled search and
+        schedules a new one, so only the final state of a typing burst
+        hits the repository.
+
+        Args:
+            event: The key event (unused).
+        """
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(300, self._run_debounced_search)
+
+    def _run_debounced_search(self):
+        """Run the search scheduled by the debounce timer."""
+        self._search_after_id = None
+        self._search_systems()
 
     def _search_systems(self):
         """Search for systems."""
@@ -479,138 +882,296 @@ class MainScreen(ctk.CTkFrame):
         if not search_text:
             return
 
-        # Update status
+        # Update status and run the blocking lookup through the task
+        # queue; user-initiated, so it jumps ahead of background work
         self.status_label.configure(text=f"Searching for: {search_text}")
+        self.search_button.configure(state="disabled")
+        self._submit(
+            functools.partial(_cached_search, self.app.system_repository, search_text),
+            on_complete=functools.partial(self._search_done, search_text),
+            on_error=self._search_error,
+            priority=10
+        )
 
-        # Get system repository
-        system_repo = self.app.system_repository
+    def _search_done(self, search_text: str, result):
+        """Apply search results on the main thread.
 
-        # Search for systems
-        try:
-            # Try exact match first
-            system = system_repo.get_by_name(search_text)
-            if system:
-                # System found, update display
-                self.status_label.configure(text=f"System found: {system.name}")
-
-                # Clear existing systems
-                for widget in self.systems_frame.winfo_children():
-                    widget.destroy()
-
-                # Create system card
-                self._create_system_card(system)
-                return
+        Args:
+            search_text: The query that produced the results.
+            result: The (system, systems) tuple from the lookup.
+        """
+        self.search_button.configure(state="normal")
+        system, systems = result
+
+        if system:
+            # Exact match found, update display
+            self.status_label.configure(text=f"System found: {system.name}")
+            self._display_systems([system])
+        elif systems:
+            # Partial matches found, update display
+            self.status_label.configure(text=f"Found {len(systems)} systems matching '{search_text}'")
+            self._display_systems(systems)
+        else:
+            # No systems found
+            self.status_label.configure(text=f"No systems found matching '{search_text}'")
+            self._show_placeholder(
+                f"No systems found matching '{search_text}'.\nTry a different search term."
+            )
+
+    def _search_error(self, error):
+        """Report a failed search on the main thread.
 
-            # Try partial match
-            systems = system_repo.get_by_filter({"name": search_text})
-            if systems:
-                # Systems found, update display
-                self.status_label.configure(text=f"Found {len(systems)} systems matching '{search_text}'")
+        Args:
+            error: The exception raised by the lookup.
+        """
+        self.search_button.configure(state="normal")
+        self._log_error(f"Error searching for systems: {error}")
+        self.status_label.configure(text=f"Error searching for systems: {str(error)[:50]}")
 
-                # Clear existing systems
-                for widget in self.systems_frame.winfo_children():
-                    widget.destroy()
+    def _display_systems(self, systems):
+        """Show search results by recycling pooled cards.
 
-                # Create system cards
-                for system in systems:
-                    self._create_system_card(system)
-                return
+        Args:
+            systems: The systems to display.
+        """
+        if self._placeholder_visible:
+            self.placeholder_label.pack_forget()
+            self._placeholder_visible = False
+
+        # Large result sets go through the virtualized path so the
+        # widget count stays constant regardless of how many matched
+        if len(systems) > VIRTUAL_THRESHOLD:
+            self._display_virtual(systems)
+            return
+        if self._virtual_mode:
+            self._leave_virtual_mode()
+
+        # Reuse existing cards in place, growing the pool only when the
+        # result set is larger than any seen before. Cards already packed
+        # stay packed (the visible prefix keeps its order), so only
+        # newly-exposed cards cost a Tcl call.
+        count = len(systems)
+        for i, (card, system) in enumerate(zip(self._card_pool, systems)):
+            card.update(system)
+            if i >= self._visible_cards:
+                card.show()
+        for system in systems[len(self._card_pool):]:
+            card = SystemCard(self.systems_frame, self._view_system, self._claim_system)
+            card.update(system)
+            card.show()
+            self._card_pool.append(card)
+
+        # Hide leftover cards from a previous, larger result set
+        for card in self._card_pool[count:self._visible_cards]:
+            card.hide()
+        self._visible_cards = count
+
+        # Trim the pool after an unusually large search so a one-off
+        # result set doesn't pin hundreds of hidden widgets forever
+        keep = max(count, CARD_POOL_MAX)
+        if len(self._card_pool) > keep:
+            excess = self._card_pool[keep:]
+            del self._card_pool[keep:]
+            self._bulk_destroy([card.card for card in excess])
+
+    def _display_virtual(self, systems):
+        """Show a large result set by rendering only the visible window.
+
+        Every result gets a fixed-height slot; the scrollregion is sized
+        for all of them but cards exist only for the ~viewport, so a
+        500-system search costs the same widgets as a 15-system one.
 
-            # No systems found
-            self.status_label.configure(text=f"No systems found matching '{search_text}'")
+        Args:
+            systems: The systems to display.
+        """
+        # Clear any pack-mode cards left over from a small result set
+        for card in self._card_pool[:self._visible_cards]:
+            card.hide()
+        self._visible_cards = 0
+
+        # Force every card to refresh on the next visibility pass, even
+        # ones whose slot index happens to match the new result set
+        for card in self._card_pool:
+            if card.row is not None:
+                card.unplace()
+
+        self._all_systems = systems
+        if not self._scroll_hooked:
+            self._hook_scroll_events()
+        self._virtual_mode = True
 
-            # Clear existing systems
-            for widget in self.systems_frame.winfo_children():
-                widget.destroy()
+        try:
+            total_height = len(systems) * CARD_ROW_H
+
+            # Pin the inner frame to the full slot layout: place() never
+            # propagates geometry, Tk clips children to the parent, and
+            # CTkScrollableFrame recomputes the scrollregion from this
+            # frame's size — so it must really be total_height tall.
+            # CTkScrollableFrame.configure routes height to the outer
+            # viewport, hence the plain Frame configure on the inner one.
+            self.systems_frame.pack_propagate(False)
+            tk.Frame.configure(self.systems_frame, height=total_height)
+
+            canvas = self.systems_frame._parent_canvas
+            canvas.configure(scrollregion=(0, 0, 0, total_height))
+            canvas.yview_moveto(0)
+        except Exception as e:
+            self._log_error(f"Error configuring scroll region: {e}")
 
-            # Show placeholder
-            self.placeholder_label = ctk.CTkLabel(
-                self.systems_frame,
-                text=f"No systems found matching '{search_text}'.\nTry a different search term.",
-                font=("Segoe UI", 14),
-                text_color="#808080"
-            )
-            self.placeholder_label.pack(pady=50)
+        self._update_visible()
+
+    def _leave_virtual_mode(self):
+        """Return the results area to the plain packed layout."""
+        for card in self._card_pool:
+            if card.row is not None:
+                card.unplace()
+        self._all_systems = []
+        self._virtual_mode = False
+
+        # Let pack geometry size the inner frame from its children again
+        try:
+            self.systems_frame.pack_propagate(True)
+        except Exception:
+            pass
+
+    def _hook_scroll_events(self):
+        """Chain into the results canvas scroll plumbing once.
+
+        The canvas reports every view change through yscrollcommand
+        (scrollbar drags, mousewheel, programmatic moves alike), so
+        intercepting it is the one place to keep the visible window
+        in sync. The scrollbar still gets its normal update.
+        """
+        try:
+            canvas = self.systems_frame._parent_canvas
+            canvas.configure(yscrollcommand=self._on_results_scroll)
+            canvas.bind("<Configure>", self._on_results_configure, add="+")
+            self._scroll_hooked = True
         except Exception as e:
-            print(f"[ERROR] Error searching for systems: {e}")
-            self.status_label.configure(text=f"Error searching for systems: {str(e)[:50]}")
+            self._log_error(f"Error hooking results scroll events: {e}")
 
-    def _create_system_card(self, system):
-        """Create a system card.
+    def _on_results_scroll(self, first, last):
+        """Forward scrollbar state and refresh the visible window.
 
         Args:
-            system: The system to display.
+            first: Top of the view as a fraction (from Tk).
+            last: Bottom of the view as a fraction (from Tk).
         """
-        # Create card frame
-        card = ctk.CTkFrame(self.systems_frame, corner_radius=10)
-        card.pack(fill="x", padx=10, pady=10)
+        try:
+            self.systems_frame._scrollbar.set(first, last)
+        except Exception:
+            pass
+        if self._virtual_mode:
+            self._update_visible()
+
+    def _on_results_configure(self, event=None):
+        """Re-evaluate the visible window when the canvas is resized."""
+        if self._virtual_mode:
+            self._update_visible()
+
+    def _update_visible(self):
+        """Map pooled cards onto the result slots currently in view."""
+        systems = self._all_systems
+        if not systems:
+            return
 
-        # Configure grid
-        card.grid_columnconfigure(1, weight=1)
+        try:
+            canvas = self.systems_frame._parent_canvas
+            top = int(canvas.canvasy(0))
+            height = canvas.winfo_height() or CARD_ROW_H
+        except Exception as e:
+            self._log_error(f"Error reading results viewport: {e}")
+            return
 
-        # Create system name
-        name_label = ctk.CTkLabel(
-            card,
-            text=system.name,
-            font=("Segoe UI", 16, "bold"),
-            text_color="#FFFFFF"
-        )
-        name_label.grid(row=0, column=0, columnspan=2, padx=15, pady=(15, 5), sticky="w")
+        first = max(0, top // CARD_ROW_H - VIRTUAL_BUFFER)
+        last = min(len(systems), (top + height) // CARD_ROW_H + 1 + VIRTUAL_BUFFER)
 
-        # Create categories
-        if system.categories:
-            categories_text = " • ".join(system.categories[:3])
-            if len(system.categories) > 3:
-                categories_text += f" (+{len(system.categories) - 3} more)"
-
-            categories_label = ctk.CTkLabel(
-                card,
-                text=categories_text,
-                font=("Segoe UI", 12),
-                text_color="#B0B0B0"
+        # Grow the pool to cover the window; the modulo mapping below
+        # then guarantees no two visible slots share a card
+        while len(self._card_pool) < last - first:
+            self._card_pool.append(
+                SystemCard(self.systems_frame, self._view_system, self._claim_system)
             )
-            categories_label.grid(row=1, column=0, columnspan=2, padx=15, pady=(0, 5), sticky="w")
+        pool_size = len(self._card_pool)
 
-        # Create coordinates
-        coords_label = ctk.CTkLabel(
-            card,
-            text=f"Coordinates: {system.x:.2f}, {system.y:.2f}, {system.z:.2f}",
-            font=("Segoe UI", 12),
-            text_color="#808080"
-        )
-        coords_label.grid(row=2, column=0, columnspan=2, padx=15, pady=(0, 15), sticky="w")
+        for i in range(first, last):
+            card = self._card_pool[i % pool_size]
+            if card.row != i:
+                card.update(systems[i])
+                card.place_at(i)
 
-        # Create view button
-        view_button = ctk.CTkButton(
-            card,
-            text="View",
-            font=("Segoe UI", 12),
-            width=80,
-            height=30,
-            command=lambda s=system: self._view_system(s)
-        )
-        view_button.grid(row=3, column=0, padx=(15, 5), pady=(0, 15), sticky="w")
+        # Retire cards scrolled out of the window
+        for card in self._card_pool:
+            if card.row is not None and not first <= card.row < last:
+                card.unplace()
 
-        # Create claim button if not claimed
-        if not system.commander:
-            claim_button = ctk.CTkButton(
-                card,
-                text="Claim",
-                font=("Segoe UI", 12),
-                width=80,
-                height=30,
-                command=lambda s=system: self._claim_system(s)
-            )
-            claim_button.grid(row=3, column=1, padx=(5, 15), pady=(0, 15), sticky="e")
-        else:
-            # Show claimed by
-            claimed_label = ctk.CTkLabel(
-                card,
-                text=f"Claimed by: {system.commander}",
-                font=("Segoe UI", 12),
-                text_color="#808080"
-            )
-            claimed_label.grid(row=3, column=1, padx=(5, 15), pady=(0, 15), sticky="e")
+    def _log_error(self, message: str):
+        """Queue an error message for the periodic log drain.
+
+        Args:
+            message: The error message (without level prefix).
+        """
+        self._log_q.put_nowait(("ERROR", message))
+
+    def _drain_log_queue(self):
+        """Flush queued log messages on the main thread.
+
+        print() flushes stdout — and with LogDisplay's redirector
+        active, appends to the log textbox — which is too slow for
+        except clauses in hot event handlers. Handlers just enqueue;
+        this after() loop re-emits the backlog in one batch via
+        print(), so messages still reach both stdout and the in-app
+        log, and the Tk text insert happens on the main thread.
+        """
+        try:
+            while True:
+                level, message = self._log_q.get_nowait()
+                print(f"[{level}] {message}")
+        except queue.Empty:
+            pass
+        self.after(100, self._drain_log_queue)
+
+    def _bulk_destroy(self, widgets):
+        """Destroy a batch of widgets with a single Tcl call.
+
+        A Python-level destroy loop round-trips to the Tcl interpreter
+        once per widget; passing the whole batch to one destroy command
+        makes a single crossing. The follow-up destroy() calls are no-ops
+        on the Tcl side but clear tkinter's Python bookkeeping.
+
+        Args:
+            widgets: The widgets to destroy.
+        """
+        if not widgets:
+            return
+
+        try:
+            self.tk.call("destroy", *(w._w for w in widgets))
+        except Exception as e:
+            self._log_error(f"Error bulk-destroying widgets: {e}")
+
+        for widget in widgets:
+            try:
+                widget.destroy()
+            except Exception:
+                pass
+
+    def _show_placeholder(self, text: str):
+        """Show the placeholder message instead of result cards.
+
+        Args:
+            text: The message to display.
+        """
+        if self._virtual_mode:
+            self._leave_virtual_mode()
+        for card in self._card_pool[:self._visible_cards]:
+            card.hide()
+        self._visible_cards = 0
+
+        self.placeholder_label.configure(text=text)
+        if not self._placeholder_visible:
+            self.placeholder_label.pack(pady=50)
+            self._placeholder_visible = True
 
     def _view_system(self, system):
         """View a system.
@@ -630,18 +1191,57 @@ class MainScreen(ctk.CTkFrame):
         # TODO: Implement system claiming
         self.status_label.configure(text=f"Claiming system: {system.name}")
 
+    def clear_search_cache(self):
+        """Clear memoized search results (call after claims or edits)."""
+        _cached_search.cache_clear()
+
+    def clear_category_cache(self):
+        """Clear the cached category list (call after category writes)."""
+        self._cat_cache = None
+
     def _toggle_filters(self):
         """Toggle filters panel."""
-        # Check if filters panel exists
-        if hasattr(self, 'filters_panel') and self.filters_panel.winfo_exists():
-            # Hide filters panel
-            self.filters_panel.destroy()
-            delattr(self, 'filters_panel')
+        # Hide the panel but keep it built; reopening is then a cheap
+        # grid() call instead of a full widget rebuild
+        if self.filters_panel is not None and self.filters_panel.winfo_ismapped():
+            self.filters_panel.grid_remove()
             self.filter_button.configure(text="Filters")
             return
 
-        # Create filters panel
-        import customtkinter as ctk
+        # Get categories from category service. The list changes rarely,
+        # so serve it from a short-lived cache instead of hitting the
+        # repository every time the panel is opened
+        categories = []
+        try:
+            now = time.monotonic()
+            if self._cat_cache is not None and now - self._cat_cache[0] < CATEGORY_CACHE_TTL:
+                categories = self._cat_cache[1]
+            else:
+                # Get category images (which contains all categories)
+                category_images = self.app.category_repository.get_category_images()
+
+                # Add "All Categories" option
+                categories = [ALL_CATEGORIES] + sorted(category_images.keys())
+                self._cat_cache = (now, categories)
+        except Exception as e:
+            self._log_error(f"Error getting categories: {e}")
+            categories = [ALL_CATEGORIES]
+
+        if self.filters_panel is None:
+            self._build_filters_panel()
+
+        # Rebuild the checkboxes only when the category list itself
+        # changed; their BooleanVars already hold the selection state
+        cat_hash = hash(tuple(categories))
+        if cat_hash != self._cat_hash:
+            self._rebuild_category_checkboxes(categories)
+            self._cat_hash = cat_hash
+
+        self.filters_panel.grid()
+        self.filter_button.configure(text="Hide Filters")
+
+    def _build_filters_panel(self):
+        """Build the persistent filters panel (without checkboxes)."""
         self.filters_panel = ctk.CTkFrame(self.tab_main)
         self.filters_panel.grid(row=0, column=1, sticky="ne", padx=(0, 20), pady=(20, 10))
 
@@ -649,52 +1249,17 @@ class MainScreen(ctk.CTkFrame):
         ctk.CTkLabel(
             self.filters_panel,
             text="Category Filters",
-            font=("Segoe UI", 14, "bold"),
-            text_color="#FF7F50"  # ACCENT_COLOR
+            font=MainScreen.FONT_HEADING_BOLD,
+            text_color=ACCENT
         ).pack(pady=(10, 5), padx=15)
 
-        # Get categories from category service
-        categories = []
-        try:
-            # Get category repository
-            category_repo = self.app.category_repository
-
-            # Get category images (which contains all categories)
-            category_images = category_repo.get_category_images()
-            categories = list(category_images.keys())
-
-            # Add "All Categories" option
-            categories = ["All Categories"] + sorted(categories)
-        except Exception as e:
-            print(f"[ERROR] Error getting categories: {e}")
-            categories = ["All Categories"]
-
         # Create scrollable frame for categories
-        categories_frame = ctk.CTkScrollableFrame(
+        self.categories_frame = ctk.CTkScrollableFrame(
             self.filters_panel,
             width=200,
             height=300
         )
-        categories_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-        # Initialize selected categories
-        if not hasattr(self, 'selected_categories'):
-            self.selected_categories = ["All Categories"]
-
-        # Create checkboxes for categories
-        self.category_vars = {}
-        for category in categories:
-            var = ctk.BooleanVar(value=category in self.selected_categories)
-            self.category_vars[category] = var
-
-            checkbox = ctk.CTkCheckBox(
-                categories_frame,
-                text=category,
-                variable=var,
-                command=self._update_selected_categories,
-                font=("Segoe UI", 12)
-            )
-            checkbox.pack(anchor="w", pady=2)
+        self.categories_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Create buttons
         buttons_frame = ctk.CTkFrame(self.filters_panel, fg_color="transparent")
@@ -704,7 +1269,7 @@ class MainScreen(ctk.CTkFrame):
         ctk.CTkButton(
             buttons_frame,
             text="Select All",
-            font=("Segoe UI", 12),
+            font=MainScreen.FONT_BODY,
             width=90,
             height=30,
             command=self._select_all_categories
@@ -714,52 +1279,81 @@ class MainScreen(ctk.CTkFrame):
         ctk.CTkButton(
             buttons_frame,
             text="Clear All",
-            font=("Segoe UI", 12),
+            font=MainScreen.FONT_BODY,
             width=90,
             height=30,
             command=self._clear_all_categories
         ).pack(side="right")
 
-        # Update filter button text
-        self.filter_button.configure(text="Hide Filters")
+    def _rebuild_category_checkboxes(self, categories):
+        """Rebuild the filter checkboxes for a changed category list.
 
-    def _update_selected_categories(self):
-        """Update the selected categories based on checkboxes."""
-        self.selected_categories = []
-        for category, var in self.category_vars.items():
-            if var.get():
-                self.selected_categories.append(category)
+        Args:
+            categories: The categories to offer.
+        """
+        self._bulk_destroy(self._category_checkboxes)
+        self._category_checkboxes = []
+
+        # Create checkboxes for categories; each toggle updates the
+        # selection set incrementally instead of rescanning every var
+        self.category_vars = {}
+        for category in categories:
+            var = ctk.BooleanVar(value=category in self.selected_categories)
+            self.category_vars[category] = var
 
-        # If "All Categories" is selected, deselect others
-        if "All Categories" in self.selected_categories and len(self.selected_categories) > 1:
-            for category, var in self.category_vars.items():
-                if category != "All Categories":
-                    var.set(False)
-            self.selected_categories = ["All Categories"]
+            checkbox = ctk.CTkCheckBox(
+                self.categories_frame,
+                text=category,
+                variable=var,
+                command=lambda c=category: self._toggle_category(c),
+                font=MainScreen.FONT_BODY
+            )
+            checkbox.pack(anchor="w", pady=2)
+            self._category_checkboxes.append(checkbox)
+
+    def _toggle_category(self, category: str):
+        """Update the selection set for a single checkbox toggle.
+
+        Args:
+            category: The toggled category.
+        """
+        var = self.category_vars[category]
+        if var.get():
+            # "All Categories" wins over individual selections
+            if category == ALL_CATEGORIES:
+                self._reset_to_all_categories()
+                return
+            if ALL_CATEGORIES in self.selected_categories:
+                var.set(False)
+                return
+            self.selected_categories.add(category)
+        else:
+            self.selected_categories.discard(category)
 
         # If no categories are selected, select "All Categories"
         if not self.selected_categories:
-            self.category_vars["All Categories"].set(True)
-            self.selected_categories = ["All Categories"]
+            self.category_vars[ALL_CATEGORIES].set(True)
+            self.selected_categories.add(ALL_CATEGORIES)
 
-    def _select_all_categories(self):
-        """Select all categories."""
+    def _reset_to_all_categories(self):
+        """Collapse the selection to just "All Categories"."""
         for category, var in self.category_vars.items():
-            var.set(True)
-        self._update_selected_categories()
+            var.set(category == ALL_CATEGORIES)
+        self.selected_categories = {ALL_CATEGORIES}
+
+    def _select_all_categories(self):
+        """Select all categories (collapses to "All Categories")."""
+        self._reset_to_all_categories()
 
     def _clear_all_categories(self):
-        """Clear all categories."""
-        for category, var in self.category_vars.items():
-            var.set(False)
-        self._update_selected_categories()
+        """Clear all categories (falls back to "All Categories")."""
+        self._reset_to_all_categories()
 
     def _open_galaxy_map(self):
         """Open the galaxy map."""
         # Get current system coordinates
         current_system = self.app.current_system
         if not current_system:
-            from tkinter import messagebox
             messagebox.showinfo(
                 "No Current System",
                 "Your current system is unknown.\nPlease jump to a system in Elite Dangerous first."
@@ -773,7 +1367,7 @@ class MainScreen(ctk.CTkFrame):
         from ui.screens.galaxy_map import ZoomableMap
 
         # Check if map window already exists
-        if hasattr(self, 'map_window') and self.map_window and hasattr(self.map_window, 'winfo_exists'):
+        if self.map_window is not None:
             try:
                 if self.map_window.winfo_exists():
                     self.map_window.lift()
@@ -795,79 +1389,162 @@ class MainScreen(ctk.CTkFrame):
         # Get current system coordinates
         current_system = self.app.current_system
         if not current_system:
-            from tkinter import messagebox
             messagebox.showinfo(
                 "No Current System",
                 "Your current system is unknown.\nPlease jump to a system in Elite Dangerous first."
             )
             return
 
-        # Update status
+        # Get selected categories
+        selected_categories = self.selected_categories
+
+        # Update status and run the repository scan off-thread
         self.status_label.configure(text="Finding unclaimed systems...")
+        self.find_unclaimed_button.configure(state="disabled")
+        self._submit(
+            functools.partial(self._do_find_unclaimed, current_system, selected_categories),
+            on_complete=self._find_unclaimed_done,
+            on_error=self._find_unclaimed_error,
+            priority=10
+        )
 
-        # Get system repository
-        system_repo = self.app.system_repository
+    def _do_find_unclaimed(self, current_system: str, selected_categories: List[str]):
+        """Blocking repository work for the unclaimed search (off-thread).
 
-        # Get current system
+        Args:
+            current_system: The current system name.
+            selected_categories: The active category filter.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: The unclaimed systems, or
+                None if the current system is unknown.
+        """
+        system_repo = self.app.system_repository
         system = system_repo.get_by_name(current_system)
         if not system:
+            return None
+
+        return system_repo.get_unclaimed_systems(
+            system.x, system.y, system.z,
+            category_filter=selected_categories,
+            limit=UNCLAIMED_LIMIT
+        )
+
+    def _find_unclaimed_done(self, unclaimed_systems):
+        """Apply unclaimed-search results on the main thread.
+
+        Args:
+            unclaimed_systems: The unclaimed systems, or None if the
+                current system is not in the database.
+        """
+        self.find_unclaimed_button.configure(state="normal")
+
+        if unclaimed_systems is None:
             self.status_label.configure(text="Current system not found in database")
             return
 
-        # Get selected categories
-        selected_categories = getattr(self, 'selected_categories', ["All Categories"])
+        if not unclaimed_systems:
+            messagebox.showinfo(
+                "No Systems",
+                "No unclaimed systems found with the current filters!"
+            )
+            self.status_label.configure(text="No unclaimed systems found")
+            return
 
-        # Find unclaimed systems
-        try:
-            unclaimed_systems = system_repo.get_unclaimed_systems(
-                system.x, system.y, system.z, 
-                category_filter=selected_categories
+        # Store unclaimed systems. They arrive sorted with distances
+        # already computed, so navigation is plain indexing; the popup
+        # labels are also formatted once here rather than per arrow-click
+        self.unclaimed_systems = unclaimed_systems
+        self.unclaimed_index = 0
+        self._unclaimed_display = [
+            (
+                entry['systems'],
+                entry.get('category', 'Unknown'),
+                f"{entry['distance']:.2f} LY away"
             )
+            for entry in unclaimed_systems
+        ]
 
-            if not unclaimed_systems:
-                from tkinter import messagebox
-                messagebox.showinfo(
-                    "No Systems",
-                    "No unclaimed systems found with the current filters!"
-                )
-                self.status_label.configure(text="No unclaimed systems found")
-                return
+        # Show nearest unclaimed system
+        self._show_nearest_unclaimed()
 
-            # Store unclaimed systems
-            self.unclaimed_systems = unclaimed_systems
-            self.unclaimed_index = 0
+        # Update status
+        self.status_label.configure(text=f"Found {len(unclaimed_systems)} unclaimed systems")
 
-            # Show nearest unclaimed system
-            self._show_nearest_unclaimed()
+    def _find_unclaimed_error(self, error):
+        """Report a failed unclaimed search on the main thread.
 
-            # Update status
-            self.status_label.configure(text=f"Found {len(unclaimed_systems)} unclaimed systems")
-        except Exception as e:
-            print(f"[ERROR] Error finding unclaimed systems: {e}")
-            self.status_label.configure(text=f"Error finding unclaimed systems: {str(e)[:50]}")
+        Args:
+            error: The exception raised by the scan.
+        """
+        self.find_unclaimed_button.configure(state="normal")
+        self._log_error(f"Error finding unclaimed systems: {error}")
+        self.status_label.configure(text=f"Error finding unclaimed systems: {str(error)[:50]}")
 
     def _show_nearest_unclaimed(self):
         """Show the nearest unclaimed system."""
-        if not hasattr(self, 'unclaimed_systems') or not self.unclaimed_systems:
+        if not self.unclaimed_systems:
             return
 
         # Get the nearest system
         nearest = self.unclaimed_systems[self.unclaimed_index]
+        self._unclaimed_current = nearest
+
+        # Build the popup once and reuse it; cycling through systems then
+        # only mutates label text instead of creating a new Tk window
+        if self._unclaimed_popup is None or not self._unclaimed_popup.winfo_exists():
+            self._build_unclaimed_popup()
+
+        name, category, distance = self._unclaimed_display[self.unclaimed_index]
+        _set_text(self._unclaimed_name_label, name)
+        _set_text(self._unclaimed_category_label, category)
+        _set_text(self._unclaimed_distance_label, distance)
+
+        self._unclaimed_popup.deiconify()
+        self._unclaimed_popup.lift()
+        self._unclaimed_popup.grab_set()
+
+    def _center_popup(self, popup, width: int, height: int):
+        """Size and center a popup with a single geometry call.
+
+        Setting the size, forcing update_idletasks, reading the window
+        size back, and issuing a second geometry call costs two geometry
+        recomputes and a forced render pass. The size is known up front,
+        so one combined call does the job.
+
+        Args:
+            popup: The toplevel to position.
+            width: The popup width.
+            height: The popup height.
+        """
+        x = (popup.winfo_screenwidth() - width) // 2
+        y = (popup.winfo_screenheight() - height) // 2
+        popup.geometry(f"{width}x{height}+{x}+{y}")
+
+    def _build_system_popup(self, window_title: str, title: str,
+                            title_color: str, dist_color: str, buttons):
+        """Build the shared system-popup skeleton.
+
+        The random-destination and nearest-unclaimed popups are the same
+        window with different text and buttons; building both here means
+        one code path and only the shared class fonts (creating a CTkFont
+        allocates a Tk font server-side, so inline ones add up).
 
-        # Create popup
-        import customtkinter as ctk
+        Args:
+            window_title: The toplevel title.
+            title: The heading text.
+            title_color: The heading color.
+            dist_color: The distance label color.
+            buttons: Iterable of (text, command, fg_color) button specs.
+
+        Returns:
+            tuple: (popup, name_label, sub_label, dist_label).
+        """
         popup = ctk.CTkToplevel(self.app)
-        popup.title("Nearest Unclaimed")
-        popup.geometry("400x250")
+        popup.title(window_title)
+        self._center_popup(popup, 400, 250)
         popup.transient(self.app)
-        popup.grab_set()
         popup.configure(fg_color="#0a0a0a")  # MAIN_BG_COLOR
-        popup.update_idletasks()
-
-        # Center popup
-        x = (popup.winfo_screenwidth() // 2) - (popup.winfo_width() // 2)
-        y = (popup.winfo_screenheight() // 2) - (popup.winfo_height() // 2)
-        popup.geometry(f"+{x}+{y}")
 
         # Create content
         content = ctk.CTkFrame(popup, fg_color="#141414", corner_radius=15)  # CARD_BG_COLOR
@@ -875,57 +1552,83 @@ class MainScreen(ctk.CTkFrame):
 
         # Create title
         ctk.CTkLabel(
-            content, 
-            text="Nearest Unclaimed System",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color="#FF7F50"  # ACCENT_COLOR
+            content,
+            text=title,
+            font=MainScreen.FONT_TITLE_BOLD,
+            text_color=title_color
         ).pack(pady=(20, 10))
 
         # Create system name
-        ctk.CTkLabel(
+        name_label = ctk.CTkLabel(
             content,
-            text=nearest['systems'],
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color="#FFFFFF"  # TEXT_COLOR
-        ).pack()
+            text="",
+            font=MainScreen.FONT_VALUE_BOLD,
+            text_color=TEXT_MAIN
+        )
+        name_label.pack()
 
-        # Create category
-        ctk.CTkLabel(
+        # Create category line
+        sub_label = ctk.CTkLabel(
             content,
-            text=nearest.get('category', 'Unknown'),
-            font=ctk.CTkFont(size=14),
-            text_color="#B0B0B0"  # TEXT_SECONDARY
-        ).pack(pady=(5, 0))
+            text="",
+            font=MainScreen.FONT_HEADING,
+            text_color=TEXT_DIM
+        )
+        sub_label.pack(pady=(5, 0))
 
         # Create distance
-        ctk.CTkLabel(
+        dist_label = ctk.CTkLabel(
             content,
-            text=f"{nearest['distance']:.2f} LY away",
-            font=ctk.CTkFont(size=16),
-            text_color="#4ECDC4"  # SUCCESS_COLOR
-        ).pack(pady=(10, 20))
+            text="",
+            font=MainScreen.FONT_DIST,
+            text_color=dist_color
+        )
+        dist_label.pack(pady=(10, 20))
 
         # Create buttons
         btn_frame = ctk.CTkFrame(content, fg_color="transparent")
         btn_frame.pack()
+        for text, command, fg_color in buttons:
+            ctk.CTkButton(
+                btn_frame,
+                text=text,
+                command=command,
+                fg_color=fg_color,
+                width=120
+            ).pack(side="left", padx=5)
 
-        # View button
-        ctk.CTkButton(
-            btn_frame, 
-            text="View Details",
-            command=lambda: (popup.destroy(), self._view_unclaimed_system(nearest)),
-            fg_color="#3498DB",  # INFO_COLOR
-            width=120
-        ).pack(side="left", padx=5)
-
-        # Close button
-        ctk.CTkButton(
-            btn_frame,
-            text="Close",
-            command=popup.destroy,
-            fg_color="#1f1f1f",  # SECONDARY_BG_COLOR
-            width=120
-        ).pack(side="left", padx=5)
+        return popup, name_label, sub_label, dist_label
+
+    def _build_unclaimed_popup(self):
+        """Build the persistent nearest-unclaimed popup."""
+        popup, name_label, sub_label, dist_label = self._build_system_popup(
+            "Nearest Unclaimed",
+            "Nearest Unclaimed System",
+            ACCENT,
+            "#4ECDC4",  # SUCCESS_COLOR
+            (
+                ("View Details", self._view_current_unclaimed, "#3498DB"),  # INFO_COLOR
+                ("Close", self._hide_unclaimed_popup, "#1f1f1f"),  # SECONDARY_BG_COLOR
+            )
+        )
+
+        # Closing hides the window so it can be shown again cheaply
+        popup.protocol("WM_DELETE_WINDOW", self._hide_unclaimed_popup)
+
+        self._unclaimed_name_label = name_label
+        self._unclaimed_category_label = sub_label
+        self._unclaimed_distance_label = dist_label
+        self._unclaimed_popup = popup
+
+    def _hide_unclaimed_popup(self):
+        """Hide the nearest-unclaimed popup without destroying it."""
+        self._unclaimed_popup.grab_release()
+        self._unclaimed_popup.withdraw()
+
+    def _view_current_unclaimed(self):
+        """View the unclaimed system currently shown in the popup."""
+        self._hide_unclaimed_popup()
+        self._view_unclaimed_system(self._unclaimed_current)
 
     def _view_unclaimed_system(self, system_data):
         """View an unclaimed system.
@@ -938,13 +1641,13 @@ class MainScreen(ctk.CTkFrame):
 
     def prev_unclaimed(self):
         """Show the previous unclaimed system."""
-        if hasattr(self, 'unclaimed_systems') and hasattr(self, 'unclaimed_index') and self.unclaimed_index > 0:
+        if self.unclaimed_systems and self.unclaimed_index > 0:
             self.unclaimed_index -= 1
             self._show_nearest_unclaimed()
 
     def next_unclaimed(self):
         """Show the next unclaimed system."""
-        if hasattr(self, 'unclaimed_systems') and hasattr(self, 'unclaimed_index') and self.unclaimed_index < len(self.unclaimed_systems) - 1:
+        if self.unclaimed_systems and self.unclaimed_index < len(self.unclaimed_systems) - 1:
             self.unclaimed_index += 1
             self._show_nearest_unclaimed()
 
@@ -953,7 +1656,6 @@ class MainScreen(ctk.CTkFrame):
         # Get current system coordinates
         current_system = self.app.current_system
         if not current_system:
-            from tkinter import messagebox
             messagebox.showinfo(
                 "No Current System",
                 "Your current system is unknown.\nPlease jump to a system in Elite Dangerous first."
@@ -974,34 +1676,22 @@ class MainScreen(ctk.CTkFrame):
 
         # Get systems
         try:
-            # Get all systems
-            all_systems = system_repo.get_all()
-            if not all_systems:
-                from tkinter import messagebox
-                messagebox.showinfo(
-                    "No Systems",
-                    "No systems found in the database!"
+            # Filter systems by distance (50-1000 LY). Repeated clicks
+            # from the same system reuse the cached candidate set; the
+            # repository serves misses from its coordinate snapshot
+            key = (current_system, 50.0, 1000.0)
+            cached = self._neighbor_cache.get(key)
+            if cached is not None:
+                candidates, distances = cached
+            else:
+                candidates, distances = system_repo.get_systems_in_range(
+                    system.x, system.y, system.z, 50.0, 1000.0
                 )
-                self.status_label.configure(text="No systems found")
-                return
-
-            # Filter systems by distance (50-1000 LY)
-            import random
-            nearby_systems = []
-
-            for sys in all_systems:
-                # Calculate distance
-                dx = sys.x - system.x
-                dy = sys.y - system.y
-                dz = sys.z - system.z
-                distance = (dx * dx + dy * dy + dz * dz) ** 0.5
+                if len(self._neighbor_cache) >= NEIGHBOR_CACHE_MAX:
+                    self._neighbor_cache.pop(next(iter(self._neighbor_cache)))
+                self._neighbor_cache[key] = (candidates, distances)
 
-                # Check distance range
-                if 50 < distance < 1000:
-                    nearby_systems.append((sys, distance))
-
-            if not nearby_systems:
-                from tkinter import messagebox
+            if not candidates:
                 messagebox.showinfo(
                     "No Systems",
                     "No systems found within 50-1000 LY of your current location!"
@@ -1009,88 +1699,35 @@ class MainScreen(ctk.CTkFrame):
                 self.status_label.configure(text="No systems found in range")
                 return
 
-            # Choose random system
-            chosen_system, distance = random.choice(nearby_systems)
+            # Choose a random index; no (system, distance) pair list is
+            # materialized just to immediately pick one element of it
+            i = random.randrange(len(candidates))
+            chosen_system = candidates[i]
+            distance = distances[i]
 
             # Create popup
-            import customtkinter as ctk
-            popup = ctk.CTkToplevel(self.app)
-            popup.title("Random Destination")
-            popup.geometry("400x250")
-            popup.transient(self.app)
+            popup, name_label, sub_label, dist_label = self._build_system_popup(
+                "Random Destination",
+                "Alternative Destination",
+                "#F39C12",  # WARNING_COLOR
+                "#3498DB",  # INFO_COLOR
+                (
+                    ("View System",
+                     lambda: (popup.destroy(), self._view_system(chosen_system)),
+                     "#F39C12"),  # WARNING_COLOR
+                    ("Try Another",
+                     lambda: (popup.destroy(), self._random_system()),
+                     "#1f1f1f"),  # SECONDARY_BG_COLOR
+                )
+            )
             popup.grab_set()
-            popup.configure(fg_color="#0a0a0a")  # MAIN_BG_COLOR
-            popup.update_idletasks()
-
-            # Center popup
-            x = (popup.winfo_screenwidth() // 2) - (popup.winfo_width() // 2)
-            y = (popup.winfo_screenheight() // 2) - (popup.winfo_height() // 2)
-            popup.geometry(f"+{x}+{y}")
-
-            # Create content
-            content = ctk.CTkFrame(popup, fg_color="#141414", corner_radius=15)  # CARD_BG_COLOR
-            content.pack(fill="both", expand=True, padx=20, pady=20)
-
-            # Create title
-            ctk.CTkLabel(
-                content, 
-                text="Alternative Destination",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color="#F39C12"  # WARNING_COLOR
-            ).pack(pady=(20, 10))
-
-            # Create system name
-            ctk.CTkLabel(
-                content,
-                text=chosen_system.name,
-                font=ctk.CTkFont(size=24, weight="bold"),
-                text_color="#FFFFFF"  # TEXT_COLOR
-            ).pack()
-
-            # Create category
-            categories_text = " • ".join(chosen_system.categories[:3]) if chosen_system.categories else "Unknown"
-            if len(chosen_system.categories) > 3:
-                categories_text += f" (+{len(chosen_system.categories) - 3} more)"
-
-            ctk.CTkLabel(
-                content,
-                text=categories_text,
-                font=ctk.CTkFont(size=14),
-                text_color="#B0B0B0"  # TEXT_SECONDARY
-            ).pack(pady=(5, 0))
-
-            # Create distance
-            ctk.CTkLabel(
-                content,
-                text=f"{distance:.2f} LY away",
-                font=ctk.CTkFont(size=16),
-                text_color="#3498DB"  # INFO_COLOR
-            ).pack(pady=(10, 20))
-
-            # Create buttons
-            btn_frame = ctk.CTkFrame(content, fg_color="transparent")
-            btn_frame.pack()
-
-            # View button
-            ctk.CTkButton(
-                btn_frame, 
-                text="View System",
-                command=lambda: (popup.destroy(), self._view_system(chosen_system)),
-                fg_color="#F39C12",  # WARNING_COLOR
-                width=120
-            ).pack(side="left", padx=5)
 
-            # Try another button
-            ctk.CTkButton(
-                btn_frame,
-                text="Try Another",
-                command=lambda: (popup.destroy(), self._random_system()),
-                fg_color="#1f1f1f",  # SECONDARY_BG_COLOR
-                width=120
-            ).pack(side="left", padx=5)
+            name_label.configure(text=chosen_system.name)
+            sub_label.configure(text=chosen_system.display_categories or "Unknown")
+            dist_label.configure(text=f"{distance:.2f} LY away")
 
             # Update status
             self.status_label.configure(text=f"Random system: {chosen_system.name}")
         except Exception as e:
-            print(f"[ERROR] Error finding random system: {e}")
+            self._log_error(f"Error finding random system: {e}")
             self.status_label.configure(text=f"Error finding random system: {str(e)[:50]}")
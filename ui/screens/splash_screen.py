@@ -5,7 +5,6 @@ Displays a loading animation while the application initializes.
 
 import os
 import time
-import threading
 import customtkinter as ctk
 
 # Try to import PIL, with fallback
@@ -28,6 +27,12 @@ except AttributeError:
 class SplashScreen(SplashBaseClass):
     """Splash screen with loading animation."""
 
+    # Seconds per full sweep of the loading bar
+    LOADING_CYCLE_S = 3.0
+
+    # Width of the loading bar in pixels (for the redraw threshold)
+    LOADING_BAR_PX = 300
+
     def __init__(self, parent):
         """Initialize the splash screen.
 
@@ -74,35 +79,18 @@ class SplashScreen(SplashBaseClass):
             self.main_frame = tk.Frame(self, background="#0a0a0a")
         self.main_frame.pack(fill="both", expand=True)
 
-        # Load logo if PIL is available and logo exists
-        if HAS_PIL:
-            logo_path = os.path.join(self._get_base_dir(), "resources", "images", "logo.png")
-            if os.path.exists(logo_path):
-                try:
-                    # Load and resize logo
-                    logo_img = Image.open(logo_path)
-                    # Use LANCZOS if available, otherwise fall back to ANTIALIAS
-                    try:
-                        resize_method = Image.LANCZOS
-                    except AttributeError:
-                        try:
-                            resize_method = Image.ANTIALIAS
-                        except AttributeError:
-                            # If neither is available, use default
-                            resize_method = Image.NEAREST
-                    logo_img = logo_img.resize((300, 300), resize_method)
-                    self.logo_photo = ImageTk.PhotoImage(logo_img)
-
-                    # Create logo label
-                    self.logo_label = ctk.CTkLabel(self.main_frame, image=self.logo_photo, text="")
-                    self.logo_label.pack(pady=(50, 20))
-                except Exception as e:
-                    print(f"[ERROR] Error loading logo: {e}")
-                    self._create_text_logo()
-            else:
-                self._create_text_logo()
+        # Load logo (from the pre-resized disk cache when possible)
+        self.logo_photo = None
+        logo_path = os.path.join(self._get_base_dir(), "resources", "images", "logo.png")
+        if os.path.exists(logo_path):
+            self.logo_photo = self._load_logo(logo_path)
+
+        if self.logo_photo is not None:
+            # Create logo label
+            self.logo_label = ctk.CTkLabel(self.main_frame, image=self.logo_photo, text="")
+            self.logo_label.pack(pady=(50, 20))
         else:
-            # Use text-based logo if PIL is not available
+            # Use text-based logo if no image could be loaded
             self._create_text_logo()
 
         # Create title label
@@ -151,11 +139,15 @@ class SplashScreen(SplashBaseClass):
         # Initialize variables
         self.progress = 0
         self.loading_animation_active = False
-        self.dots_animation_active = False
-        self._stop_event = threading.Event()
+        self._closed = False
+
+        # Pending after() callbacks, cancelled on close so no dead
+        # callback fires against the destroyed window
+        self._tick_after_id = None
+        self._emergency_after_id = None
 
         # Emergency close timer (in case something goes wrong)
-        self.after(15000, self.emergency_close)
+        self._emergency_after_id = self.after(15000, self.emergency_close)
 
     def _get_base_dir(self) -> str:
         """Get the base directory of the application.
@@ -169,6 +161,60 @@ class SplashScreen(SplashBaseClass):
         else:
             return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+    def _load_logo(self, logo_path: str):
+        """Load the 300x300 logo, preferring the pre-resized disk cache.
+
+        The first launch pays for the PIL decode and Lanczos resize and
+        saves the result under ~/.edrh/cache, keyed by the source file's
+        mtime so an updated logo rebuilds the cache. Later launches load
+        the pre-sized PNG through the native Tk reader without touching
+        PIL at all.
+
+        Args:
+            logo_path: Path to the source logo image.
+
+        Returns:
+            The PhotoImage for the logo label, or None on failure.
+        """
+        import tkinter as tk
+
+        try:
+            mtime = int(os.path.getmtime(logo_path))
+            cache_dir = os.path.join(os.path.expanduser("~"), ".edrh", "cache")
+            cache_path = os.path.join(cache_dir, f"logo_300x300_{mtime}.png")
+
+            # Cache hit: skip PIL entirely
+            if os.path.exists(cache_path):
+                return tk.PhotoImage(file=cache_path)
+
+            if not HAS_PIL:
+                return None
+
+            # Load and resize logo
+            logo_img = Image.open(logo_path)
+            # Use LANCZOS if available, otherwise fall back to ANTIALIAS
+            try:
+                resize_method = Image.LANCZOS
+            except AttributeError:
+                try:
+                    resize_method = Image.ANTIALIAS
+                except AttributeError:
+                    # If neither is available, use default
+                    resize_method = Image.NEAREST
+            logo_img = logo_img.resize((300, 300), resize_method)
+
+            # Save the resized copy for the next launch
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                logo_img.save(cache_path, optimize=True)
+            except Exception as e:
+                print(f"[WARNING] Could not cache resized logo: {e}")
+
+            return ImageTk.PhotoImage(logo_img)
+        except Exception as e:
+            print(f"[ERROR] Error loading logo: {e}")
+            return None
+
     def _create_text_logo(self):
         """Create a text-based logo when image is not available."""
         self.logo_label = ctk.CTkLabel(
@@ -181,63 +227,63 @@ class SplashScreen(SplashBaseClass):
 
     def start_loading_animation(self):
         """Start the loading animation."""
-        if not self.loading_animation_active:
+        if not self.loading_animation_active and not self._closed:
             self.loading_animation_active = True
-            self.animate_loading()
-
-        if not self.dots_animation_active:
-            self.dots_animation_active = True
-            self.animate_dots()
-
-    def animate_loading(self):
-        """Animate the loading bar."""
-        if self._stop_event.is_set() or not self.loading_animation_active:
+            self._anim_start = time.monotonic()
+            self._last_px = -1
+            self._tick_count = 0
+            self._tick()
+
+    def _tick(self):
+        """Advance the loading bar and dots from a single timer.
+
+        One 50ms after() loop drives both animations. The bar position
+        comes from elapsed wall time, so dropped frames don't slow the
+        sweep down, and set() is skipped while the change stays below a
+        pixel. The dots advance every sixth tick (~300ms, as before).
+        """
+        if self._closed:
             return
 
-        def update_progress():
-            """Update the progress bar."""
-            if self._stop_event.is_set() or not self.loading_animation_active:
-                return
+        # Compute bar position from the shared clock
+        elapsed = time.monotonic() - self._anim_start
+        self.progress = (elapsed / self.LOADING_CYCLE_S) % 1.0
 
-            # Increment progress
-            self.progress += 0.01
-            if self.progress >= 1:
-                self.progress = 0
-
-            # Update progress bar
+        # Update the bar only when it would visibly move
+        px = int(self.progress * self.LOADING_BAR_PX)
+        if px != self._last_px:
+            self._last_px = px
             self.loading_bar.set(self.progress)
 
-            # Schedule next update
-            if not self._stop_event.is_set() and self.loading_animation_active:
-                self.after(30, update_progress)
-
-        # Start progress updates
-        update_progress()
-
-    def animate_dots(self):
-        """Animate the loading text dots."""
-        if self._stop_event.is_set() or not self.dots_animation_active:
-            return
-
-        # Cycle through different dot patterns
-        dots = ["", ".", "..", "..."]
-        self.dot_index = getattr(self, 'dot_index', 0)
-
-        # Update text with current dot pattern
-        self.loading_text.configure(text=f"Initializing{dots[self.dot_index]}")
-
-        # Increment dot index
-        self.dot_index = (self.dot_index + 1) % len(dots)
+        # Update the dots pattern
+        if self._tick_count % 6 == 0:
+            dots = ["", ".", "..", "..."]
+            self.loading_text.configure(
+                text=f"Initializing{dots[(self._tick_count // 6) % len(dots)]}"
+            )
+        self._tick_count += 1
 
         # Schedule next update
-        if not self._stop_event.is_set() and self.dots_animation_active:
-            self.after(300, self.animate_dots)
+        self._tick_after_id = self.after(50, self._tick)
 
     def close_splash(self):
         """Close the splash screen."""
+        if self._closed:
+            return
+        self._closed = True
         self.loading_animation_active = False
-        self.dots_animation_active = False
-        self._stop_event.set()
+
+        # Cancel pending callbacks so none fire against the destroyed
+        # window during shutdown
+        for after_id in (self._tick_after_id, self._emergency_after_id):
+            if after_id is not None:
+                try:
+                    self.after_cancel(after_id)
+                except Exception:
+                    pass
+        self._tick_after_id = None
+        self._emergency_after_id = None
+
         self.destroy()
 
     def emergency_close(self):
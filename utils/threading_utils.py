@@ -0,0 +1,634 @@
+"""
+Threading utilities for Elite Dangerous Records Helper.
+Provides background task execution with a shared worker pool so UI
+callbacks can run database and network work off the Tk main thread.
+"""
+
+import collections
+import inspect
+import itertools
+import logging
+import os
+import threading
+import traceback
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# Try to import tkthread, with fallback. When available, callbacks are
+# marshalled through Tcl's thread::send, which interrupts the mainloop
+# instead of waiting for an after(0) timer tick.
+try:
+    import tkthread
+    HAS_TKTHREAD = True
+except ImportError:
+    tkthread = None
+    HAS_TKTHREAD = False
+
+
+class BackgroundTask:
+    """A cancellable unit of work executed off the Tk main thread.
+
+    Callbacks (on_complete, on_error, on_progress) are marshalled back
+    onto the main thread with root.after(), since Tk widgets must only
+    be touched from the thread that created them.
+    """
+
+    def __init__(self, task_func, on_complete=None, on_error=None, on_progress=None):
+        """Initialize the background task.
+
+        Args:
+            task_func: The callable to execute. If it accepts a
+                progress_callback argument, one is supplied.
+            on_complete: Called with the result on success.
+            on_error: Called with the exception on failure.
+            on_progress: Called with (progress, message) updates.
+        """
+        self.task_func = task_func
+
+        # Bound widget methods are held weakly so an in-flight task
+        # does not keep a closed window's whole widget tree alive
+        self.on_complete = self._wrap_callback(on_complete)
+        self.on_error = self._wrap_callback(on_error)
+        self.on_progress = self._wrap_callback(on_progress)
+
+        # Decide once which optional kwargs the task function takes;
+        # introspecting inside every run is wasted work and raises for
+        # C callables
+        self._accepts_progress = self._detect_param(task_func, 'progress_callback',
+                                                    '_accepts_progress')
+        self._accepts_cancel_event = self._detect_param(task_func, 'cancel_event',
+                                                        '_accepts_cancel_event')
+        self.is_running = False
+        self.result = None
+        self.error = None
+        self.thread = None
+
+        # Cancellation signal; an Event so the queue can cancel a task
+        # from any thread without holding a lock
+        self._cancel_evt = threading.Event()
+
+        # Latest unreported progress, coalesced so a chatty task posts
+        # at most one Tcl event per mainloop pass
+        self._pending_progress = None
+        self._progress_scheduled = False
+
+        # Set by the queue when tkthread is available; used for
+        # low-latency completion dispatch
+        self._tkt = None
+
+        # Set when _run finishes (success, error or cancellation), so
+        # wait() works whether the task ran on a pool worker or on its
+        # own thread
+        self._done_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        """bool: Whether cancellation has been requested."""
+        return self._cancel_evt.is_set()
+
+    # Older call sites read is_cancelled; keep it as an alias
+    is_cancelled = cancelled
+
+    @staticmethod
+    def _wrap_callback(callback):
+        """Wrap a bound method callback in a WeakMethod.
+
+        Args:
+            callback: The callback, or None.
+
+        Returns:
+            The WeakMethod, or the callback unchanged when it is not a
+            bound method (plain functions keep their strong ref).
+        """
+        if callback is not None and inspect.ismethod(callback):
+            return weakref.WeakMethod(callback)
+        return callback
+
+    @staticmethod
+    def _resolve_callback(callback):
+        """Get the live callable behind a stored callback.
+
+        Args:
+            callback: The stored callback, possibly a WeakMethod.
+
+        Returns:
+            The callable, or None if it was a WeakMethod whose target
+            has been garbage collected.
+        """
+        if isinstance(callback, weakref.WeakMethod):
+            return callback()
+        return callback
+
+    @staticmethod
+    def _detect_param(task_func, param, marker):
+        """Check whether a callable accepts a given keyword argument.
+
+        Args:
+            task_func: The callable to inspect.
+            param: The parameter name to look for.
+            marker: Attribute that, when set on the callable, bypasses
+                signature inspection.
+
+        Returns:
+            bool: True if the callable takes the parameter.
+        """
+        marked = getattr(task_func, marker, None)
+        if marked is not None:
+            return marked
+        try:
+            return param in inspect.signature(task_func).parameters
+        except (TypeError, ValueError):
+            # Builtins and some C callables have no signature
+            return False
+
+    def start(self, root=None, inline=False):
+        """Run the task.
+
+        Args:
+            root: The Tk root window used to marshal callbacks.
+            inline: When True (set by pool workers), execute the task
+                body synchronously on the calling thread, avoiding a
+                per-task thread spawn. When False, run on a fresh
+                daemon thread for standalone use.
+        """
+        if inline:
+            self._run(root)
+        else:
+            self.thread = threading.Thread(target=self._run, args=(root,), daemon=True)
+            self.thread.start()
+
+    def _run(self, root=None):
+        """Execute the task body on the calling thread.
+
+        Args:
+            root: The Tk root window used to marshal callbacks, or None
+                to invoke callbacks directly on this thread.
+        """
+        self.is_running = True
+        try:
+            kwargs = {}
+
+            # Tasks that block can wait on the cancel event instead of
+            # polling a flag
+            if self._accepts_cancel_event:
+                kwargs['cancel_event'] = self._cancel_evt
+
+            # Supply a progress callback if the task function wants one
+            if self._accepts_progress:
+                def progress_callback(progress, message=""):
+                    if self._cancel_evt.is_set():
+                        return False
+                    cb = self._resolve_callback(self.on_progress)
+                    if cb is not None:
+                        if root is not None:
+                            # Overwrite the pending slot; only the
+                            # newest update matters to the UI
+                            self._pending_progress = (progress, message)
+                            if not self._progress_scheduled:
+                                self._progress_scheduled = True
+                                root.after_idle(self._flush_progress)
+                        else:
+                            cb(progress, message)
+                    return True
+                kwargs['progress_callback'] = progress_callback
+
+            self.result = self.task_func(**kwargs)
+
+            if not self.is_cancelled:
+                cb = self._resolve_callback(self.on_complete)
+                if cb is not None:
+                    self._dispatch(root, cb, self.result)
+        except Exception as e:
+            self.error = e
+            cb = self._resolve_callback(self.on_error)
+            if cb is None:
+                logger.exception("Background task failed")
+            else:
+                # The handler owns logging; stash the traceback so it
+                # can format it on demand without re-walking frames
+                e._tb = traceback.TracebackException.from_exception(e)
+                if not self.is_cancelled:
+                    self._dispatch(root, cb, e)
+        finally:
+            self.is_running = False
+            self._done_event.set()
+
+    def _dispatch(self, root, func, *args):
+        """Invoke a callback on the Tk main thread.
+
+        Uses tkthread's thread::send path when the queue provided one
+        (microsecond latency, no timer event); otherwise falls back to
+        root.after(0), or calls directly when there is no root.
+
+        Args:
+            root: The Tk root window, or None for direct invocation.
+            func: The callback to invoke.
+            *args: Arguments for the callback.
+        """
+        if root is None:
+            func(*args)
+            return
+
+        # The window may have been torn down while the task ran;
+        # scheduling on it would raise TclError
+        try:
+            if not root.winfo_exists():
+                return
+        except Exception:
+            return
+
+        if self._tkt is not None:
+            try:
+                self._tkt.nosync(func, *args)
+                return
+            except Exception:
+                pass
+        # after() forwards extra args itself; no closure allocation
+        root.after(0, func, *args)
+
+    def _flush_progress(self):
+        """Deliver the newest pending progress update on the main thread.
+
+        Runs via root.after_idle; bursts of progress ticks posted while
+        the mainloop was busy collapse into this single call.
+        """
+        self._progress_scheduled = False
+        pending = self._pending_progress
+        self._pending_progress = None
+        if pending is not None and not self.is_cancelled:
+            cb = self._resolve_callback(self.on_progress)
+            if cb is not None:
+                cb(*pending)
+
+    def wait(self, timeout=None):
+        """Wait for the task to finish.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait forever.
+
+        Returns:
+            bool: True if the task finished, False on timeout.
+        """
+        return self._done_event.wait(timeout)
+
+    def cancel(self):
+        """Request cancellation.
+
+        The task function sees this through the progress callback
+        returning False or its cancel_event being set; completion
+        callbacks are suppressed.
+        """
+        self._cancel_evt.set()
+
+
+class TaskQueue:
+    """Task queue sharded across per-worker deques, with work stealing.
+
+    add_task places each task on one worker's local deque round-robin,
+    so submissions from different threads rarely touch the same lock;
+    a worker that runs dry steals from its peers before sleeping on its
+    own condition. Interactive tasks (priority >= 10) jump to the front
+    of their shard's deque; ordering is otherwise FIFO per shard rather
+    than a global priority order. Worker loops run on daemon threads,
+    so a process that exits without calling stop() never hangs on an
+    idle worker blocked in wait().
+    """
+
+    def __init__(self, max_workers=None, min_workers=1):
+        """Initialize the task queue.
+
+        Args:
+            max_workers: Upper bound on worker threads; the pool grows
+                toward this on demand when new shards receive work.
+                Defaults to the stdlib executor heuristic
+                min(32, cpu_count + 4); since CPU-bound Python code is
+                GIL-serialized anyway, the headroom mostly benefits
+                I/O-bound work like DB queries and HTTP fetches.
+            min_workers: Threads spawned up front in start(), so the
+                first burst of tasks does not pay thread-creation
+                latency.
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.max_workers = max_workers
+        self.min_workers = min(min_workers, max_workers)
+
+        # Plain dict and counter; CPython guarantees single-key dict
+        # ops and next() on a count are atomic under the GIL, so the
+        # hot enqueue/dequeue path needs no lock
+        self.tasks = {}
+        self._next_id = itertools.count()
+        self.running = False
+        self.root = None
+
+        # One local deque and condition per worker slot; add_task
+        # round-robins across them so dispatch never funnels through a
+        # single central lock
+        self._locals = [collections.deque() for _ in range(self.max_workers)]
+        self._conds = [threading.Condition() for _ in range(self.max_workers)]
+        self._started = [False] * self.max_workers
+        self._rr = itertools.count()
+
+        # Bumped by every start(); a loop spawned under an older
+        # generation retires itself, so stop()/start() cycles never
+        # leave a shard owned by a dead worker or served twice
+        self._run_gen = 0
+
+        # Mass-cancel generation; queued tasks from an older generation
+        # are skipped on pop, so cancel_all_tasks never scans the shards
+        self._cancel_gen = 0
+
+        # tkthread dispatcher, created in start() when available
+        self._tkt = None
+
+    def start(self, root=None):
+        """Start the worker pool.
+
+        Args:
+            root: The Tk root window used to marshal task callbacks.
+        """
+        if self.running:
+            return
+        self.running = True
+        self._run_gen += 1
+        self.root = root
+
+        # Prefer thread::send dispatch when tkthread and the Tcl Thread
+        # extension are present; _dispatch falls back to after(0)
+        if HAS_TKTHREAD and root is not None:
+            try:
+                self._tkt = tkthread.TkThread(root)
+            except Exception as e:
+                print(f"[WARNING] tkthread dispatch unavailable, using after(): {e}")
+                self._tkt = None
+
+        # Launch the minimum worker loops up front; add_task starts a
+        # shard's owner lazily the first time work lands on it
+        for idx in range(self.min_workers):
+            self._ensure_worker(idx)
+
+    def _ensure_worker(self, idx):
+        """Start the worker loop owning shard `idx` if not yet running.
+
+        Args:
+            idx: The worker slot index.
+        """
+        if self._started[idx]:
+            return
+        with self._conds[idx]:
+            if not self._started[idx]:
+                self._started[idx] = True
+                # Daemon threads: the interpreter may exit while a
+                # worker is blocked in wait() without joining it
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    args=(idx, self._run_gen),
+                    name=f"edrh-task_{idx}",
+                    daemon=True
+                )
+                worker.start()
+
+    def add_task(self, task, priority=0):
+        """Queue a task for execution.
+
+        Args:
+            task: The BackgroundTask to run.
+            priority: Tasks at 10 or above go to the front of their
+                shard's deque; the rest run FIFO within the shard.
+
+        Returns:
+            int: The task id, usable with cancel_task().
+        """
+        task_id = next(self._next_id)
+        task._gen = self._cancel_gen
+        self.tasks[task_id] = (task, priority)
+
+        idx = next(self._rr) % self.max_workers
+        if self.running:
+            self._ensure_worker(idx)
+        cond = self._conds[idx]
+        with cond:
+            if priority >= 10:
+                self._locals[idx].appendleft(task_id)
+            else:
+                self._locals[idx].append(task_id)
+            cond.notify()
+        return task_id
+
+    def cancel_task(self, task_id):
+        """Cancel a queued or running task.
+
+        Args:
+            task_id: The id returned by add_task().
+
+        Returns:
+            bool: True if the task was found and cancelled.
+        """
+        entry = self.tasks.get(task_id)
+        if entry is None:
+            return False
+        entry[0].cancel()
+        return True
+
+    def cancel_all_tasks(self):
+        """Cancel every queued and running task."""
+        # Bump the generation first so entries still queued are dead on
+        # arrival even before their cancel event is set
+        self._cancel_gen += 1
+        for task, _ in list(self.tasks.values()):
+            task.cancel()
+
+    def _steal(self, idx):
+        """Try to take one task from a peer's deque.
+
+        Peers whose lock is momentarily held are skipped rather than
+        waited on; stealing is strictly opportunistic.
+
+        Args:
+            idx: The stealing worker's own slot index.
+
+        Returns:
+            Optional[int]: A stolen task id, or None.
+        """
+        for offset in range(1, self.max_workers):
+            peer = (idx + offset) % self.max_workers
+            cond = self._conds[peer]
+            if not cond.acquire(blocking=False):
+                continue
+            try:
+                if self._locals[peer]:
+                    return self._locals[peer].popleft()
+            finally:
+                cond.release()
+        return None
+
+    def _worker_loop(self, idx, gen):
+        """Worker loop owning shard `idx`, hosted on a daemon thread.
+
+        Pops from its own deque first, then tries to steal from peers,
+        and only then sleeps on its own condition. The shard lock is
+        released before the task body runs, so peers pop and steal
+        concurrently. Exits when stop() clears the running flag or a
+        restart supersedes this loop's generation.
+
+        No task_done()/join()-style completion bookkeeping is kept:
+        nothing waits on queue drain, and the per-dispatch lock/notify
+        it would cost is pure overhead for tiny tasks. Callers that
+        need to know when a task finished use BackgroundTask.wait().
+
+        Args:
+            idx: This worker's slot index.
+            gen: The run generation this loop was spawned under.
+        """
+        my_queue = self._locals[idx]
+        my_cond = self._conds[idx]
+        while True:
+            live = self.running and self._run_gen == gen
+            task_id = None
+            with my_cond:
+                if my_queue and live:
+                    task_id = my_queue.popleft()
+                elif not live:
+                    return
+
+            if task_id is None:
+                task_id = self._steal(idx)
+
+            if task_id is None:
+                with my_cond:
+                    while (not my_queue and self.running
+                            and self._run_gen == gen):
+                        my_cond.wait()
+                continue
+
+            self._run_task(task_id)
+
+    def _run_task(self, task_id):
+        """Execute one popped task. Called without the condition held.
+
+        Args:
+            task_id: The id popped from a shard.
+        """
+        entry = self.tasks.get(task_id)
+        if entry is None:
+            return
+
+        task, _ = entry
+
+        # Skip entries cancelled while queued — individually or by a
+        # mass-cancel generation bump — without scanning the shards
+        if task._cancel_evt.is_set() or task._gen < self._cancel_gen:
+            self.tasks.pop(task_id, None)
+            return
+
+        task._tkt = self._tkt
+        task.start(self.root, inline=True)
+        self.tasks.pop(task_id, None)
+
+    def stop(self):
+        """Stop the worker loops and drop any queued tasks."""
+        self.running = False
+        self.cancel_all_tasks()
+
+        # Drain each shard and wake its worker so the loops observe
+        # running=False and exit; shard ownership resets so a later
+        # start() spawns fresh loops instead of deadlocking. Drained
+        # ids also leave the registry — a task that will never run must
+        # not stay visible to cancel_task()
+        for i, (local, cond) in enumerate(zip(self._locals, self._conds)):
+            with cond:
+                for task_id in local:
+                    self.tasks.pop(task_id, None)
+                local.clear()
+                self._started[i] = False
+                cond.notify_all()
+
+
+
+# Shared application-wide task queue
+_task_queue = None
+
+
+def init_task_queue(root=None, max_workers=None, min_workers=1):
+    """Create and start the shared task queue.
+
+    Args:
+        root: The Tk root window used to marshal task callbacks.
+        max_workers: Upper bound on worker threads; None auto-sizes
+            from the CPU count.
+        min_workers: Threads spawned up front.
+
+    Returns:
+        TaskQueue: The shared task queue.
+    """
+    global _task_queue
+    if _task_queue is None:
+        # Make tkinter's Tcl interpreter thread-aware before any
+        # background dispatch happens; harmless if already patched
+        if HAS_TKTHREAD:
+            try:
+                tkthread.patch()
+            except Exception as e:
+                print(f"[WARNING] tkthread.patch() failed: {e}")
+        _task_queue = TaskQueue(max_workers=max_workers, min_workers=min_workers)
+        _task_queue.start(root)
+    return _task_queue
+
+
+def get_task_queue():
+    """Get the shared task queue.
+
+    Returns:
+        Optional[TaskQueue]: The shared queue, or None if not initialized.
+    """
+    return _task_queue
+
+
+def run_in_background(on_complete=None, on_error=None, on_progress=None, priority=0):
+    """Decorator that runs the wrapped callable through the shared queue.
+
+    Falls back to a standalone thread when the queue has not been
+    initialized.
+
+    Args:
+        on_complete: Called with the result on success.
+        on_error: Called with the exception on failure.
+        on_progress: Called with (progress, message) updates.
+        priority: Queue priority; higher values run sooner.
+
+    Returns:
+        The decorated function, which returns its BackgroundTask.
+    """
+    def decorator(func):
+        # Resolve the optional kwargs once at decoration time; the
+        # per-call closures below defeat BackgroundTask's own cache
+        accepts_progress = BackgroundTask._detect_param(
+            func, 'progress_callback', '_accepts_progress')
+        accepts_cancel = BackgroundTask._detect_param(
+            func, 'cancel_event', '_accepts_cancel_event')
+
+        def wrapper(*args, **kwargs):
+            if accepts_progress or accepts_cancel:
+                def task_func(**extra):
+                    return func(*args, **kwargs, **extra)
+            else:
+                def task_func():
+                    return func(*args, **kwargs)
+
+            # Pre-marked so BackgroundTask skips signature inspection
+            task_func._accepts_progress = accepts_progress
+            task_func._accepts_cancel_event = accepts_cancel
+
+            task = BackgroundTask(task_func, on_complete, on_error, on_progress)
+            task_queue = get_task_queue()
+            if task_queue is not None and task_queue.running:
+                task_queue.add_task(task, priority)
+            else:
+                task.start()
+            return task
+
+        wrapper._accepts_progress = accepts_progress
+        wrapper._accepts_cancel_event = accepts_cancel
+        return wrapper
+    return decorator